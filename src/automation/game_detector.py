@@ -1,18 +1,105 @@
+import os
+import sys
 import psutil
 import time
 import threading
 
 class GameDetector:
+    """
+    Edge-triggered detection of the game process
+
+    Once the game is found its PID is cached and only that PID is checked
+    afterwards. While waiting for the game on Linux, only PIDs that newly
+    appeared under /proc are inspected instead of every process on the
+    system; other platforms fall back to a psutil scan.
+    """
+
+    GAME_PROCESS = 'League of Legends.exe'
+
+    def __init__(self, poll_interval=5.0, full_rescan_interval=60.0):
+        self.poll_interval = poll_interval
+
+        # Periodically re-inspect every PID, in case a process was first
+        # seen before it exec'd into the game
+        self.full_rescan_interval = full_rescan_interval
+
+        self.game_pid = None
+        self.known_pids = None
+        self.last_full_scan = 0.0
+        self.use_proc = sys.platform.startswith('linux') and os.path.isdir('/proc')
+
+        self.running = False
+        self.thread = None
+
     def is_game_running(self):
-        for proc in psutil.process_iter(['name']):
-            if 'League of Legends.exe' in proc.info.get('name', ''):
+        if self.game_pid is not None:
+            if self._is_game_process(self.game_pid):
                 return True
-        return False
-    
-    def start_monitoring(self, callback):
+            self.game_pid = None
+
+        self.game_pid = self._find_game_pid()
+        return self.game_pid is not None
+
+    def _find_game_pid(self):
+        """Look for the game among new processes (or all, as a fallback)"""
+        if self.use_proc:
+            return self._scan_new_pids()
+
+        for proc in psutil.process_iter(['name']):
+            if self.GAME_PROCESS in (proc.info.get('name') or ''):
+                return proc.pid
+        return None
+
+    def _scan_new_pids(self):
+        """Inspect only the /proc entries that appeared since the last scan"""
+        now = time.time()
+        pids = {int(entry) for entry in os.listdir('/proc') if entry.isdigit()}
+
+        if self.known_pids is None or now - self.last_full_scan > self.full_rescan_interval:
+            new_pids = pids
+            self.last_full_scan = now
+        else:
+            new_pids = pids - self.known_pids
+        self.known_pids = pids
+
+        for pid in new_pids:
+            if self._is_game_process(pid):
+                return pid
+        return None
+
+    def _is_game_process(self, pid):
+        """Check that a PID is alive and is the game (guards PID reuse)"""
+        try:
+            return self.GAME_PROCESS in psutil.Process(pid).name()
+        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+            return False
+
+    def start_monitoring(self, callback, on_game_ended=None):
+        """
+        Watch for the game in a background thread
+
+        Args:
+            callback: Called once each time the game starts
+            on_game_ended: Optional, called once each time the game exits
+        """
+        if self.running:
+            return
+
         def monitor():
-            while True:
-                if self.is_game_running():
+            was_running = False
+            while self.running:
+                running = self.is_game_running()
+                if running and not was_running:
                     callback()
-                time.sleep(5)
-        threading.Thread(target=monitor, daemon=True).start()
+                elif was_running and not running and on_game_ended:
+                    on_game_ended()
+                was_running = running
+                time.sleep(self.poll_interval)
+
+        self.running = True
+        self.thread = threading.Thread(target=monitor, daemon=True)
+        self.thread.start()
+
+    def stop_monitoring(self):
+        """Stop the background watcher"""
+        self.running = False
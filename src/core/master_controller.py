@@ -9,6 +9,8 @@ from src.analysis.positioning_optimizer import PositioningOptimizer
 from src.analysis.itemization_guide import ItemizationGuide
 from src.analysis.counter_analyzer import CounterAnalyzer
 from src.automation.game_detector import GameDetector
+from src.utilities.comp_index import CompIndex
+from src.utilities.champion_recognizer import ChampionRecognizer
 
 class MasterController:
     """Central controller orchestrating all systems"""
@@ -27,6 +29,13 @@ class MasterController:
         self.counter_analyzer = CounterAnalyzer()
         self.game_detector = GameDetector()
         
+        # Comp index over the last top comps, rebuilt when they change
+        self.comp_index = None
+        self.comp_index_signature = None
+        
+        # Built on first use; persists template features through self.db
+        self.champion_recognizer = None
+        
         print("Master Controller initialized!")
     
     def initialize_data(self, force_update=False):
@@ -104,22 +113,34 @@ class MasterController:
         try:
             top_comps = self.db.get_top_comps(limit=5)
             
+            signature = tuple((comp['name'], tuple(comp['champions'] or [])) for comp in top_comps)
+            if signature != self.comp_index_signature:
+                self.comp_index = CompIndex(top_comps, units_key='champions')
+                self.comp_index_signature = signature
+            
             recommendations = []
-            for comp in top_comps:
-                matches = len(set(current_units) & set(comp['champions']))
-                if matches > 0:
-                    recommendations.append({
-                        'name': comp['name'],
-                        'matches': matches,
-                        'tier': comp['tier'],
-                        'win_rate': comp['win_rate']
-                    })
+            for comp, matches, _ in self.comp_index.match(current_units):
+                recommendations.append({
+                    'name': comp['name'],
+                    'matches': matches,
+                    'tier': comp['tier'],
+                    'win_rate': comp['win_rate']
+                })
             
             return sorted(recommendations, key=lambda x: x['matches'], reverse=True)
         except:
             return []
     
+    def get_champion_recognizer(self, templates_dir="champion_templates"):
+        """Get the champion recognizer, backed by the database feature cache"""
+        if self.champion_recognizer is None:
+            self.champion_recognizer = ChampionRecognizer(templates_dir, db_manager=self.db)
+        return self.champion_recognizer
+    
     def start_auto_monitoring(self):
         """Start automatic game detection and monitoring"""
-        self.game_detector.start_monitoring(lambda: print("Game detected!"))
+        self.game_detector.start_monitoring(
+            lambda: print("Game detected!"),
+            on_game_ended=lambda: print("Game ended")
+        )
         print("Auto-monitoring started")
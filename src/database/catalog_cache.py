@@ -0,0 +1,105 @@
+import copy
+import threading
+from .models import Champion, Item, Augment, Composition, Trait
+
+class CatalogCache:
+    """
+    In-memory read-through copy of the static game catalog
+
+    Champions, items, traits, augments and compositions are loaded in one
+    pass into plain dicts keyed by name, so lookups are dictionary hits
+    with no session or ORM work. The copy is tagged with the manager's
+    data_version and reloaded on the first lookup after any write bumps
+    it. Writes from other processes are not seen until the next bump.
+    """
+
+    TABLES = ('champions', 'items', 'traits', 'augments', 'compositions')
+
+    def __init__(self, db_manager):
+        self.db = db_manager
+        self.tables = {table: {} for table in self.TABLES}
+        self.version = None
+        self.lock = threading.Lock()
+
+    def get(self, table, name):
+        """
+        Look up one catalog entry
+
+        Returns:
+            A deep copy of the entry dict, or None if not found
+        """
+        entry = self._get_tables()[table].get(name)
+        return copy.deepcopy(entry) if entry is not None else None
+
+    def get_all(self, table):
+        """Get deep copies of every entry in a catalog table"""
+        return [copy.deepcopy(entry) for entry in self._get_tables()[table].values()]
+
+    def invalidate(self):
+        """Force a reload on the next lookup"""
+        with self.lock:
+            self.version = None
+
+    def _get_tables(self):
+        """Return the catalog, reloading it if the data version moved"""
+        version = self.db.data_version
+        if self.version == version:
+            return self.tables
+
+        with self.lock:
+            if self.version != version:
+                # Tag with the version read before loading, so a write that
+                # lands mid-load triggers another reload
+                self.tables = self._load()
+                self.version = version
+            return self.tables
+
+    def _load(self):
+        """Read the whole catalog in one read-only session"""
+        tables = {table: {} for table in self.TABLES}
+
+        with self.db.read_session_scope() as session:
+            for c in session.query(Champion).order_by(Champion.id):
+                tables['champions'][c.name] = {
+                    'id': c.id,
+                    'name': c.name,
+                    'cost': c.cost,
+                    'traits': c.traits,
+                    'stats': c.stats
+                }
+
+            for i in session.query(Item).order_by(Item.id):
+                tables['items'][i.name] = {
+                    'name': i.name,
+                    'components': i.components,
+                    'priority_score': i.priority_score,
+                    'recommended_for': i.recommended_for
+                }
+
+            for t in session.query(Trait).order_by(Trait.id):
+                tables['traits'][t.name] = {
+                    'name': t.name,
+                    'breakpoints': t.breakpoints,
+                    'description': t.description
+                }
+
+            for a in session.query(Augment).order_by(Augment.id):
+                tables['augments'][a.name] = {
+                    'name': a.name,
+                    'tier': a.tier,
+                    'tier_list_rank': a.tier_list_rank,
+                    'win_rate': a.win_rate
+                }
+
+            # Same name in several patches: keep the first row, like get_composition did
+            for c in session.query(Composition).order_by(Composition.id):
+                tables['compositions'].setdefault(c.name, {
+                    'name': c.name,
+                    'champions': c.champions,
+                    'positioning': c.positioning,
+                    'items_priority': c.items_priority,
+                    'tier': c.tier,
+                    'win_rate': c.win_rate
+                })
+
+        return tables
@@ -1,21 +1,132 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.dialects.sqlite import insert
 from sqlalchemy.orm import sessionmaker, scoped_session
+from sqlalchemy.pool import QueuePool
 from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
 import os
+import sqlite3
+import threading
+from .catalog_cache import CatalogCache
 from .models import Base, Champion, Item, Augment, Composition, ChampionTemplate, MatchHistory, Trait
 
+# SQLite PRAGMA settings applied to every new connection
+PERFORMANCE_PROFILES = {
+    # WAL lets overlay reads run concurrently with scraper writes;
+    # synchronous=NORMAL is crash-safe under WAL (only the last commits
+    # can be lost on power failure)
+    'fast': {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'mmap_size': 256 * 1024 * 1024,
+        'cache_size': -64000,  # KiB
+        'temp_store': 'MEMORY',
+        'busy_timeout': 5000
+    },
+    'safe': {
+        'journal_mode': 'WAL',
+        'synchronous': 'FULL',
+        'busy_timeout': 5000
+    },
+    # SQLite defaults (rollback journal, full sync)
+    'default': {}
+}
+
+# Settings that only make sense on connections that can write
+WRITE_ONLY_PRAGMAS = ('journal_mode',)
+
+
 class DatabaseManager:
     """Central database manager with session handling"""
 
-    def __init__(self, db_path='data/tft_overlay.db'):
+    def __init__(self, db_path='data/tft_overlay.db', profile='fast', read_pool_size=4):
+        """
+        Args:
+            db_path: SQLite database file
+            profile: Name in PERFORMANCE_PROFILES or a dict of PRAGMA values
+            read_pool_size: Connections kept open for read-only queries
+        """
         # Ensure data directory exists
         os.makedirs(os.path.dirname(db_path), exist_ok=True)
 
-        self.engine = create_engine(f'sqlite:///{db_path}', echo=False)
+        self.pragmas = PERFORMANCE_PROFILES[profile] if isinstance(profile, str) else dict(profile)
+
+        # Connect through percent-encoded file: URIs so '#', '%', '?' and
+        # Windows paths reach SQLite intact
+        db_uri = Path(db_path).resolve().as_uri()
+
+        self.engine = self._create_sqlite_engine(db_uri)
+        self._apply_pragmas(self.engine, self.pragmas)
         self.Session = scoped_session(sessionmaker(bind=self.engine))
 
         # Create all tables
         Base.metadata.create_all(self.engine)
+        self._ensure_unique_indexes()
+
+        # Separate read-only pool for analysis threads
+        read_pragmas = {k: v for k, v in self.pragmas.items() if k not in WRITE_ONLY_PRAGMAS}
+        self.read_engine = self._create_sqlite_engine(
+            f'{db_uri}?mode=ro',
+            pool_size=read_pool_size,
+            max_overflow=read_pool_size
+        )
+        self._apply_pragmas(self.read_engine, read_pragmas)
+        self.ReadSession = sessionmaker(bind=self.read_engine)
+
+        # Bumped after every catalog write; invalidates the catalog cache
+        self.data_version = 0
+        self.version_lock = threading.Lock()
+        self.catalog = CatalogCache(self)
+
+    def _create_sqlite_engine(self, uri, **pool_args):
+        """Engine over a SQLite file: URI, bypassing SQLAlchemy's URL parsing of the path"""
+        return create_engine(
+            'sqlite://',
+            creator=lambda: sqlite3.connect(uri, uri=True, check_same_thread=False),
+            poolclass=QueuePool,
+            echo=False,
+            **pool_args
+        )
+
+    def _apply_pragmas(self, engine, pragmas):
+        """Set the PRAGMAs on every connection the engine opens"""
+        @event.listens_for(engine, "connect")
+        def set_pragmas(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+            cursor.close()
+
+    def _ensure_unique_indexes(self):
+        """Add unique indexes that create_all() won't add to existing tables"""
+        with self.engine.begin() as conn:
+            exists = conn.execute(text(
+                "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'uq_compositions_name_patch'"
+            )).first()
+            if exists:
+                return
+
+            # One-time migration: older databases may hold duplicate comps;
+            # keep the newest row of each
+            conn.execute(text(
+                "DELETE FROM compositions WHERE id NOT IN "
+                "(SELECT MAX(id) FROM compositions GROUP BY name, patch)"
+            ))
+            conn.execute(text(
+                "CREATE UNIQUE INDEX uq_compositions_name_patch "
+                "ON compositions (name, patch)"
+            ))
+
+    @contextmanager
+    def read_session_scope(self):
+        """Provide a read-only session from the reader pool"""
+        session = self.ReadSession()
+        try:
+            yield session
+        finally:
+            session.rollback()
+            session.close()
 
     @contextmanager
     def session_scope(self):
@@ -30,10 +141,23 @@ class DatabaseManager:
         finally:
             session.close()
 
+    @contextmanager
+    def catalog_write_scope(self):
+        """Transactional scope that invalidates the catalog cache once committed"""
+        try:
+            with self.session_scope() as session:
+                yield session
+        finally:
+            self._bump_data_version()
+
+    def _bump_data_version(self):
+        with self.version_lock:
+            self.data_version += 1
+
     # Champion operations
     def upsert_champion(self, champ_data):
         """Insert or update champion"""
-        with self.session_scope() as session:
+        with self.catalog_write_scope() as session:
             champ = session.query(Champion).filter_by(name=champ_data['name']).first()
             if champ:
                 for key, value in champ_data.items():
@@ -45,28 +169,49 @@ class DatabaseManager:
 
     def get_champion(self, name):
         """Get champion by name"""
-        with self.session_scope() as session:
-            champ = session.query(Champion).filter_by(name=name).first()
-            if champ:
-                return {
-                    'id': champ.id,
-                    'name': champ.name,
-                    'cost': champ.cost,
-                    'traits': champ.traits,
-                    'stats': champ.stats
-                }
-            return None
+        return self.catalog.get('champions', name)
 
     def get_all_champions(self):
         """Get all champions"""
+        return [{'id': c['id'], 'name': c['name'], 'cost': c['cost'], 'traits': c['traits']}
+                for c in self.catalog.get_all('champions')]
+
+    # Champion template operations
+    def upsert_champion_template(self, champion_name, template_path, histogram_data, star_level=1):
+        """Insert or update a recognition template and its precomputed features"""
         with self.session_scope() as session:
-            return [{'id': c.id, 'name': c.name, 'cost': c.cost, 'traits': c.traits}
-                    for c in session.query(Champion).all()]
+            champ = session.query(Champion).filter_by(name=champion_name).first()
+
+            template = session.query(ChampionTemplate).filter_by(template_path=template_path).first()
+            if template:
+                template.champion_id = champ.id if champ else None
+                template.star_level = star_level
+                template.histogram_data = dict(histogram_data, champion=champion_name)
+            else:
+                template = ChampionTemplate(
+                    champion_id=champ.id if champ else None,
+                    star_level=star_level,
+                    template_path=template_path,
+                    histogram_data=dict(histogram_data, champion=champion_name)
+                )
+                session.add(template)
+                session.flush()
+            return template.id
+
+    def get_champion_templates(self):
+        """Get all recognition templates with their precomputed features"""
+        with self.read_session_scope() as session:
+            return [{
+                'champion': (t.histogram_data or {}).get('champion') or (t.champion.name if t.champion else None),
+                'star_level': t.star_level,
+                'template_path': t.template_path,
+                'histogram_data': t.histogram_data
+            } for t in session.query(ChampionTemplate).all()]
 
     # Item operations
     def upsert_item(self, item_data):
         """Insert or update item"""
-        with self.session_scope() as session:
+        with self.catalog_write_scope() as session:
             item = session.query(Item).filter_by(name=item_data['name']).first()
             if item:
                 for key, value in item_data.items():
@@ -78,27 +223,23 @@ class DatabaseManager:
 
     def get_item(self, name):
         """Get item by name"""
-        with self.session_scope() as session:
-            item = session.query(Item).filter_by(name=name).first()
-            if item:
-                return {
-                    'name': item.name,
-                    'components': item.components,
-                    'priority_score': item.priority_score,
-                    'recommended_for': item.recommended_for
-                }
-            return None
+        return self.catalog.get('items', name)
 
     def get_top_items(self, limit=10):
         """Get highest priority items"""
-        with self.session_scope() as session:
+        with self.read_session_scope() as session:
             items = session.query(Item).order_by(Item.priority_score.desc()).limit(limit).all()
             return [{'name': i.name, 'priority_score': i.priority_score} for i in items]
 
+    # Trait operations
+    def get_trait(self, name):
+        """Get trait by name"""
+        return self.catalog.get('traits', name)
+
     # Augment operations
     def upsert_augment(self, aug_data):
         """Insert or update augment"""
-        with self.session_scope() as session:
+        with self.catalog_write_scope() as session:
             aug = session.query(Augment).filter_by(name=aug_data['name']).first()
             if aug:
                 for key, value in aug_data.items():
@@ -110,27 +251,18 @@ class DatabaseManager:
 
     def get_augment(self, name):
         """Get augment by name"""
-        with self.session_scope() as session:
-            aug = session.query(Augment).filter_by(name=name).first()
-            if aug:
-                return {
-                    'name': aug.name,
-                    'tier': aug.tier,
-                    'tier_list_rank': aug.tier_list_rank,
-                    'win_rate': aug.win_rate
-                }
-            return None
+        return self.catalog.get('augments', name)
 
     def get_augments_by_tier(self, tier_rank):
         """Get augments by tier rank (S/A/B/C/D)"""
-        with self.session_scope() as session:
+        with self.read_session_scope() as session:
             augs = session.query(Augment).filter_by(tier_list_rank=tier_rank).all()
             return [{'name': a.name, 'tier': a.tier, 'win_rate': a.win_rate} for a in augs]
 
     # Composition operations
     def upsert_composition(self, comp_data):
         """Insert or update composition"""
-        with self.session_scope() as session:
+        with self.catalog_write_scope() as session:
             comp = session.query(Composition).filter_by(
                 name=comp_data['name'],
                 patch=comp_data.get('patch', 'current')
@@ -146,22 +278,11 @@ class DatabaseManager:
 
     def get_composition(self, name):
         """Get composition by name"""
-        with self.session_scope() as session:
-            comp = session.query(Composition).filter_by(name=name).first()
-            if comp:
-                return {
-                    'name': comp.name,
-                    'champions': comp.champions,
-                    'positioning': comp.positioning,
-                    'items_priority': comp.items_priority,
-                    'tier': comp.tier,
-                    'win_rate': comp.win_rate
-                }
-            return None
+        return self.catalog.get('compositions', name)
 
     def get_top_comps(self, limit=10):
         """Get top meta compositions"""
-        with self.session_scope() as session:
+        with self.read_session_scope() as session:
             comps = session.query(Composition).order_by(
                 Composition.tier,
                 Composition.win_rate.desc()
@@ -175,6 +296,72 @@ class DatabaseManager:
                 'avg_placement': c.avg_placement
             } for c in comps]
 
+    # Bulk operations
+    def bulk_upsert_compositions(self, comps):
+        """
+        Insert or update many compositions in one transaction
+
+        Returns:
+            dict with 'inserted' and 'updated' row counts
+        """
+        comps = [dict(comp, patch=comp.get('patch') or 'current') for comp in comps]
+        return self._bulk_upsert(Composition, comps, ('name', 'patch'))
+
+    def bulk_upsert_augments(self, augments):
+        """Insert or update many augments in one transaction (returns counts)"""
+        return self._bulk_upsert(Augment, augments, ('name',))
+
+    def bulk_upsert_items(self, items):
+        """Insert or update many items in one transaction (returns counts)"""
+        return self._bulk_upsert(Item, items, ('name',))
+
+    def _bulk_upsert(self, model, records, key_columns):
+        """
+        INSERT ... ON CONFLICT DO UPDATE for a batch of records
+
+        Records are grouped by their set of keys so each group runs as one
+        executemany; existing keys are found with a single SELECT up front
+        to report how many rows were inserted vs updated.
+        """
+        if not records:
+            return {'inserted': 0, 'updated': 0}
+
+        columns = set(model.__table__.columns.keys())
+        for record in records:
+            unknown = set(record) - columns
+            if unknown:
+                raise ValueError(f"Unknown {model.__tablename__} columns: {', '.join(sorted(unknown))}")
+
+        groups = {}
+        for record in records:
+            groups.setdefault(tuple(sorted(record)), []).append(record)
+
+        now = datetime.utcnow()
+        key_attrs = [getattr(model, column) for column in key_columns]
+
+        with self.catalog_write_scope() as session:
+            existing = set()
+            names = list({record['name'] for record in records})
+            for start in range(0, len(names), 500):
+                rows = session.query(*key_attrs).filter(model.name.in_(names[start:start + 500]))
+                existing.update(tuple(row) for row in rows)
+
+            inserted = 0
+            for record in records:
+                key = tuple(record.get(column) for column in key_columns)
+                if key not in existing:
+                    existing.add(key)
+                    inserted += 1
+
+            for keys, rows in groups.items():
+                stmt = insert(model)
+                updates = {column: stmt.excluded[column] for column in keys if column not in key_columns}
+                updates['updated_at'] = now
+                stmt = stmt.on_conflict_do_update(index_elements=list(key_columns), set_=updates)
+                session.execute(stmt, rows)
+
+        return {'inserted': inserted, 'updated': len(records) - inserted}
+
     # Match history operations
     def save_match(self, match_data):
         """Save match to history"""
@@ -185,7 +372,7 @@ class DatabaseManager:
 
     def get_match_stats(self, limit=20):
         """Get statistics from recent matches"""
-        with self.session_scope() as session:
+        with self.read_session_scope() as session:
             matches = session.query(MatchHistory).order_by(
                 MatchHistory.timestamp.desc()
             ).limit(limit).all()
@@ -204,6 +391,6 @@ class DatabaseManager:
     # Utility
     def clear_old_data(self, patch):
         """Clear data from old patches"""
-        with self.session_scope() as session:
+        with self.catalog_write_scope() as session:
             session.query(Composition).filter(Composition.patch != patch).delete()
             session.commit()
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, JSON, ForeignKey, Boolean
+from sqlalchemy import Column, Integer, String, Float, DateTime, JSON, ForeignKey, Boolean, Index
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -68,6 +68,9 @@ class Composition(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    # One row per comp per patch (conflict target for bulk upserts)
+    __table_args__ = (Index('uq_compositions_name_patch', 'name', 'patch', unique=True),)
+
 class ChampionTemplate(Base):
     """Champion portrait templates for CV recognition"""
     __tablename__ = 'champion_templates'
@@ -1,12 +1,15 @@
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox, simpledialog
 import json
+import difflib
+import threading
 from utilities.game_state import GameState
 from utilities.analyzer import Analyzer
 from utilities.screen_capture import ScreenCapture
 from utilities.ocr_reader import OCRReader
 from utilities.board_detector import BoardDetector
 from utilities.auto_updater import AutoUpdater
+from utilities.ui_bridge import UIUpdateBus, BackgroundTaskRunner
 from utilities.advanced_features import MatchHistory, CompLibrary, HotkeyManager, ThemeManager, EconomyTracker
 
 class TFTOverlayEnhanced:
@@ -41,6 +44,14 @@ class TFTOverlayEnhanced:
         # Create UI
         self.create_widgets()
         
+        # Auto-update snapshots are rendered on the Tk main loop only
+        self.ui_bus = UIUpdateBus(root, self.render_state)
+        self.ui_bus.start()
+        
+        # Slow actions (analysis, capture, OCR) run off the main thread
+        self.tasks = BackgroundTaskRunner(root, on_status=self.status_var.set)
+        self.analysis_lock = threading.Lock()
+        
         # Phase 5: Hotkeys
         self.hotkey_manager = HotkeyManager(self)
         self.hotkey_manager.bind_hotkeys(root)
@@ -92,6 +103,7 @@ class TFTOverlayEnhanced:
         self.state_display.pack(padx=10, pady=5)
         self.state_display.insert(tk.END, "No game state loaded")
         self.state_display.config(state=tk.DISABLED)
+        self.state_view = IncrementalTextView(self.state_display)
         
         # Buttons
         button_frame = ttk.Frame(self.main_tab)
@@ -116,6 +128,7 @@ class TFTOverlayEnhanced:
         self.recommendation.pack(padx=10, pady=5)
         self.recommendation.insert(tk.END, "Click 'Get Hint' for recommendations")
         self.recommendation.config(state=tk.DISABLED)
+        self.recommendation_view = IncrementalTextView(self.recommendation)
         
     def create_stats_tab(self):
         ttk.Label(self.stats_tab, text="Match History", font=("Arial", 12, "bold")).pack(pady=10)
@@ -164,30 +177,49 @@ class TFTOverlayEnhanced:
                       command=lambda t=theme_name: self.change_theme(t)).pack(side=tk.LEFT, padx=5)
         
     def get_hint(self):
-        self.status_var.set("Analyzing...")
-        self.root.update()
-        
         if not self.game_state.is_valid():
             messagebox.showwarning("No Game State", "Please input a valid game state first")
             self.status_var.set("No game state")
             return
         
-        hint = self.analyzer.analyze(self.game_state)
+        self.status_var.set("Analyzing...")
+        self.tasks.submit("hint", self._generate_hint, self.snapshot_state(),
+                          on_done=self._show_hint, on_error=self._show_error)
+        
+    def _generate_hint(self, task, snapshot):
+        """Build the hint text (worker thread)"""
+        state = GameState()
+        state.load_from_dict(snapshot)
+        
+        with self.analysis_lock:
+            hint = self.analyzer.analyze(state)
+        
+        if task.cancelled:
+            return None
+        task.report("Adding economy advice...")
         
         # Add economy advice
-        economy_advice = self.economy_tracker.get_economy_advice(
-            self.game_state.gold, self.game_state.level
-        )
+        economy_advice = self.economy_tracker.get_economy_advice(state.gold, state.level)
         if economy_advice:
             hint += "\n\nEconomy:\n" + "\n".join(f"- {a}" for a in economy_advice)
         
-        self.recommendation.config(state=tk.NORMAL)
-        self.recommendation.delete(1.0, tk.END)
-        self.recommendation.insert(tk.END, hint)
-        self.recommendation.config(state=tk.DISABLED)
+        return hint
         
+    def _show_hint(self, hint):
+        if hint is None:
+            return
+        self.recommendation_view.set_text(hint)
         self.status_var.set("Hint generated")
         
+    def _show_error(self, error):
+        self.status_var.set("Error")
+        messagebox.showerror("Error", str(error))
+        
+    def snapshot_state(self):
+        """Copy the game state for use on another thread"""
+        with self.auto_updater.state_lock:
+            return self.game_state.to_dict()
+        
     def input_state(self):
         dialog = GameStateDialog(self.root)
         self.root.wait_window(dialog.dialog)
@@ -197,10 +229,8 @@ class TFTOverlayEnhanced:
                 state_data = json.loads(dialog.result)
                 self.game_state.load_from_dict(state_data)
                 
-                self.state_display.config(state=tk.NORMAL)
-                self.state_display.delete(1.0, tk.END)
-                self.state_display.insert(tk.END, self.game_state.get_display_text())
-                self.state_display.config(state=tk.DISABLED)
+                self.state_view.set_text(self.game_state.get_display_text())
+                self.ui_bus.invalidate()
                 
                 self.status_var.set("Game state loaded")
             except json.JSONDecodeError:
@@ -208,39 +238,46 @@ class TFTOverlayEnhanced:
                 
     def capture_screen(self):
         self.status_var.set("Capturing...")
-        try:
-            img = self.screen_capture.capture_full_screen()
-            filepath = self.screen_capture.save_capture(img)
-            self.status_var.set(f"Captured: {filepath}")
-        except Exception as e:
-            messagebox.showerror("Error", str(e))
+        self.tasks.submit("capture", self._capture_and_save,
+                          on_done=lambda filepath: self.status_var.set(f"Captured: {filepath}"),
+                          on_error=self._show_error)
+        
+    def _capture_and_save(self, task):
+        img = self.screen_capture.capture_full_screen()
+        return self.screen_capture.save_capture(img)
             
     def ocr_analyze(self):
         self.status_var.set("OCR analyzing...")
-        try:
-            img = self.screen_capture.capture_full_screen()
-            stats = self.ocr_reader.read_game_stats(img)
-            
-            if stats['level'] > 0:
+        self.tasks.submit("ocr", self._read_screen_stats,
+                          on_done=self._apply_ocr_stats, on_error=self._show_error)
+        
+    def _read_screen_stats(self, task):
+        """Capture the screen and OCR the HUD (worker thread)"""
+        img = self.screen_capture.capture_full_screen()
+        task.report("Reading HUD...")
+        return self.ocr_reader.read_game_stats(img)
+        
+    def _apply_ocr_stats(self, stats):
+        if stats['level'] > 0:
+            with self.auto_updater.state_lock:
                 self.game_state.level = stats['level']
                 self.game_state.gold = stats['gold']
                 self.game_state.health = stats['health']
                 self.game_state.stage = stats['stage']
-                
-                self.state_display.config(state=tk.NORMAL)
-                self.state_display.delete(1.0, tk.END)
-                self.state_display.insert(tk.END, f"OCR Detected:\n")
-                self.state_display.insert(tk.END, f"Stage: {stats['stage']}\n")
-                self.state_display.insert(tk.END, f"Level: {stats['level']}\n")
-                self.state_display.insert(tk.END, f"Gold: {stats['gold']}\n")
-                self.state_display.insert(tk.END, f"Health: {stats['health']}\n")
-                self.state_display.config(state=tk.DISABLED)
-                
-                self.status_var.set("OCR complete")
-            else:
-                messagebox.showwarning("OCR Failed", "Could not detect game state")
-        except Exception as e:
-            messagebox.showerror("Error", str(e))
+            
+            self.state_view.set_text(
+                f"OCR Detected:\n"
+                f"Stage: {stats['stage']}\n"
+                f"Level: {stats['level']}\n"
+                f"Gold: {stats['gold']}\n"
+                f"Health: {stats['health']}\n"
+            )
+            self.ui_bus.invalidate()
+            
+            self.status_var.set("OCR complete")
+        else:
+            self.status_var.set("OCR failed")
+            messagebox.showwarning("OCR Failed", "Could not detect game state")
             
     def toggle_auto_update(self):
         if self.auto_updater.is_running():
@@ -253,11 +290,14 @@ class TFTOverlayEnhanced:
             self.status_var.set("Auto-update started")
             
     def on_auto_update(self):
-        """Callback when auto-updater detects changes"""
-        self.state_display.config(state=tk.NORMAL)
-        self.state_display.delete(1.0, tk.END)
-        self.state_display.insert(tk.END, self.game_state.get_display_text())
-        self.state_display.config(state=tk.DISABLED)
+        """Callback when auto-updater detects changes (runs on a worker thread)"""
+        self.ui_bus.publish(self.snapshot_state())
+        
+    def render_state(self, snapshot):
+        """Draw a game state snapshot (main thread only, via the UI bus)"""
+        state = GameState()
+        state.load_from_dict(snapshot)
+        self.state_view.set_text(state.get_display_text())
         
     def refresh_stats(self):
         stats = self.match_history.get_stats()
@@ -296,10 +336,8 @@ class TFTOverlayEnhanced:
                 self.game_state.synergies = comp['synergies']
                 self.game_state.level = comp['level']
                 
-                self.state_display.config(state=tk.NORMAL)
-                self.state_display.delete(1.0, tk.END)
-                self.state_display.insert(tk.END, self.game_state.get_display_text())
-                self.state_display.config(state=tk.DISABLED)
+                self.state_view.set_text(self.game_state.get_display_text())
+                self.ui_bus.invalidate()
                 
                 messagebox.showinfo("Loaded", f"Loaded '{name}'")
                 
@@ -328,6 +366,48 @@ class TFTOverlayEnhanced:
         theme = self.theme_manager.apply_theme(self.root, theme_name)
         messagebox.showinfo("Theme", f"Theme changed to {theme_name}")
 
+class IncrementalTextView:
+    """
+    Keeps a read-only Text widget in sync with a string, redrawing only
+    the lines that changed
+
+    The new text is diffed line by line against what was last rendered and
+    only the differing line ranges are deleted/inserted, so a few changed
+    numbers don't cost a full redraw (or reset the scroll position).
+    """
+    
+    def __init__(self, widget):
+        self.widget = widget
+        self.lines = None  # Lines currently shown (None = untracked content)
+        
+    def set_text(self, text):
+        """Show text, touching only the changed line ranges"""
+        lines = text.split("\n")
+        if lines == self.lines:
+            return
+        
+        self.widget.config(state=tk.NORMAL)
+        
+        if self.lines is None:
+            # Every line (including the last) ends in a newline, so line
+            # start indices stay valid for insertions at the end
+            self.widget.delete(1.0, tk.END)
+            self.widget.insert(tk.END, "".join(line + "\n" for line in lines))
+        else:
+            matcher = difflib.SequenceMatcher(None, self.lines, lines, autojunk=False)
+            
+            # Apply bottom-up so earlier line indices stay valid
+            for tag, i1, i2, j1, j2 in reversed(matcher.get_opcodes()):
+                if tag == "equal":
+                    continue
+                if i2 > i1:
+                    self.widget.delete(f"{i1 + 1}.0", f"{i2 + 1}.0")
+                if j2 > j1:
+                    self.widget.insert(f"{i1 + 1}.0", "".join(line + "\n" for line in lines[j1:j2]))
+                    
+        self.widget.config(state=tk.DISABLED)
+        self.lines = lines
+
 class GameStateDialog:
     def __init__(self, parent):
         self.result = None
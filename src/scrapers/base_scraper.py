@@ -1,29 +1,216 @@
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
+import hashlib
+import json
+import os
+import threading
 import time
 from datetime import datetime, timedelta
+from urllib.parse import urlparse
+
+_session = None
+_session_lock = threading.Lock()
+
+_rate_limiters = {}
+_rate_limiters_lock = threading.Lock()
+
+
+def get_shared_session():
+    """Get the process-wide keep-alive HTTP session (created on first use)"""
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16)
+            _session.mount('http://', adapter)
+            _session.mount('https://', adapter)
+        return _session
+
+
+def get_rate_limiter(host, rate=1.0, burst=3):
+    """Get the token bucket for a host (rate/burst apply on first use)"""
+    with _rate_limiters_lock:
+        if host not in _rate_limiters:
+            _rate_limiters[host] = TokenBucket(rate, burst)
+        return _rate_limiters[host]
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket rate limiter
+
+    Holds up to `capacity` tokens, refilled at `rate` tokens per second;
+    acquire() takes one token, waiting only as long as needed for it.
+    """
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available, then take it"""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+
+            time.sleep(wait)
+
+
+class HTTPCache:
+    """
+    On-disk HTTP response cache keyed by URL
+
+    Stores each response body next to a small JSON file with its ETag and
+    Last-Modified validators, so later requests can be sent conditionally
+    and answered with a bodyless 304 when nothing changed. Entries stay
+    marked unparsed until the caller confirms with mark_parsed(), so a 304
+    for a body that failed to parse hands the cached body back instead.
+    """
+
+    def __init__(self, cache_dir='data/http_cache'):
+        self.cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _paths(self, url):
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()[:32]
+        base = os.path.join(self.cache_dir, key)
+        return base + '.json', base + '.body'
+
+    def get_metadata(self, url):
+        """Get the stored validators of a URL (None if not cached)"""
+        meta_file, body_file = self._paths(url)
+        if not os.path.exists(meta_file) or not os.path.exists(body_file):
+            return None
+
+        try:
+            with open(meta_file, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def conditional_headers(self, url):
+        """Get If-None-Match / If-Modified-Since headers for a cached URL"""
+        meta = self.get_metadata(url)
+        if not meta:
+            return {}
+
+        headers = {}
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+        return headers
+
+    def store(self, url, response):
+        """Save a 200 response body with its validators"""
+        meta_file, body_file = self._paths(url)
+
+        self._write(body_file, response.content)
+        self._write(meta_file, json.dumps({
+            'url': url,
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'fetched_at': datetime.now().isoformat(),
+            'parsed': False
+        }).encode('utf-8'))
+
+    def mark_parsed(self, url):
+        """Record that the cached body of a URL was parsed successfully"""
+        meta = self.get_metadata(url)
+        if meta and not meta.get('parsed'):
+            meta['parsed'] = True
+            self._write(self._paths(url)[0], json.dumps(meta).encode('utf-8'))
+
+    def is_parsed(self, url):
+        """Check whether the cached body of a URL was parsed successfully"""
+        meta = self.get_metadata(url)
+        return bool(meta and meta.get('parsed'))
+
+    def load_body(self, url):
+        """Get the cached body of a URL as text (None if not cached)"""
+        _, body_file = self._paths(url)
+        if not os.path.exists(body_file):
+            return None
+
+        with open(body_file, 'rb') as f:
+            return f.read().decode('utf-8', errors='replace')
+
+    def _write(self, path, data):
+        """Write a file atomically so readers never see a partial entry"""
+        partial = f"{path}.{threading.get_ident()}.part"
+        with open(partial, 'wb') as f:
+            f.write(data)
+        os.replace(partial, path)
+
 
 class BaseScraper:
     """Base class for web scrapers with common functionality"""
 
-    def __init__(self, base_url, cache_duration_hours=6):
+    def __init__(self, base_url, cache_duration_hours=6, session=None, requests_per_second=1.0, burst=3,
+                 cache_dir='data/http_cache'):
         self.base_url = base_url
         self.cache_duration = timedelta(hours=cache_duration_hours)
-        self.last_fetch = {}
+
+        # Responses and fetch times persist across restarts
+        self.http_cache = HTTPCache(cache_dir)
+        self.last_fetch_file = os.path.join(cache_dir, f"last_fetch_{urlparse(base_url).netloc or 'local'}.json")
+        self.last_fetch_lock = threading.Lock()
+        self.last_fetch = self._load_last_fetch()
+
+        # Pooled keep-alive connections shared by all scrapers
+        self.session = session or get_shared_session()
+
+        # Per-host politeness limit (replaces a fixed sleep after every request)
+        self.requests_per_second = requests_per_second
+        self.burst = burst
 
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
 
-    def fetch_page(self, url, max_retries=3):
-        """Fetch a web page with retry logic"""
+    def fetch_page(self, url, max_retries=3, conditional=True):
+        """
+        Fetch a web page with retry logic
+
+        With conditional=True the request carries the cached validators;
+        if the server answers 304 Not Modified, None is returned so the
+        caller can skip parsing and saving entirely. If the cached body was
+        never marked parsed, it is parsed again instead. Callers confirm a
+        successful parse with self.http_cache.mark_parsed(url).
+        """
+        # Be respectful - rate limit per host
+        limiter = get_rate_limiter(urlparse(url).netloc, self.requests_per_second, self.burst)
+
+        headers = dict(self.headers)
+        if conditional:
+            headers.update(self.http_cache.conditional_headers(url))
+
         for attempt in range(max_retries):
             try:
-                response = requests.get(url, headers=self.headers, timeout=10)
-                response.raise_for_status()
+                limiter.acquire()
+                response = self.session.get(url, headers=headers, timeout=10)
+
+                if response.status_code == 304:
+                    if self.http_cache.is_parsed(url):
+                        return None
 
-                # Be respectful - rate limit
-                time.sleep(1)
+                    # The last parse of this body failed: retry it from the cache
+                    body = self.http_cache.load_body(url)
+                    return BeautifulSoup(body, 'html.parser') if body is not None else None
+
+                response.raise_for_status()
+                self.http_cache.store(url, response)
 
                 return BeautifulSoup(response.text, 'html.parser')
 
@@ -41,7 +228,23 @@ class BaseScraper:
 
     def mark_fetched(self, key):
         """Mark a resource as fetched"""
-        self.last_fetch[key] = datetime.now()
+        with self.last_fetch_lock:
+            self.last_fetch[key] = datetime.now()
+
+            data = {k: v.isoformat() for k, v in self.last_fetch.items()}
+            with open(self.last_fetch_file, 'w') as f:
+                json.dump(data, f)
+
+    def _load_last_fetch(self):
+        """Load persisted fetch times"""
+        if not os.path.exists(self.last_fetch_file):
+            return {}
+
+        try:
+            with open(self.last_fetch_file, 'r') as f:
+                return {k: datetime.fromisoformat(v) for k, v in json.load(f).items()}
+        except (OSError, ValueError):
+            return {}
 
     def extract_text_safe(self, element, selector, default=""):
         """Safely extract text from BeautifulSoup element"""
@@ -6,16 +6,23 @@ class MetaTFTScraper(BaseScraper):
 
     BASE_URL = "https://www.metatft.com"
 
-    def __init__(self):
-        super().__init__(self.BASE_URL)
+    def __init__(self, base_url=None, **kwargs):
+        super().__init__(base_url or self.BASE_URL, **kwargs)
 
-    def scrape_compositions(self):
+    def scrape_compositions(self, force=False):
         """Scrape top meta compositions"""
-        if not self.should_fetch('compositions'):
+        if not force and not self.should_fetch('compositions'):
             return []
 
         try:
-            soup = self.fetch_page(f"{self.BASE_URL}/comps")
+            url = f"{self.base_url}/comps"
+            soup = self.fetch_page(url, conditional=not force)
+
+            # Not modified since the last scrape: nothing to parse or save
+            if soup is None:
+                self.mark_fetched('compositions')
+                return []
+
             compositions = []
 
             # Find composition cards
@@ -37,6 +44,7 @@ class MetaTFTScraper(BaseScraper):
                 except Exception as e:
                     continue
 
+            self.http_cache.mark_parsed(url)
             self.mark_fetched('compositions')
             return compositions
 
@@ -44,13 +52,20 @@ class MetaTFTScraper(BaseScraper):
             print(f"Failed to scrape compositions: {e}")
             return self._get_fallback_compositions()
 
-    def scrape_augments(self):
+    def scrape_augments(self, force=False):
         """Scrape augment tier list"""
-        if not self.should_fetch('augments'):
+        if not force and not self.should_fetch('augments'):
             return []
 
         try:
-            soup = self.fetch_page(f"{self.BASE_URL}/augments")
+            url = f"{self.base_url}/augments"
+            soup = self.fetch_page(url, conditional=not force)
+
+            # Not modified since the last scrape: nothing to parse or save
+            if soup is None:
+                self.mark_fetched('augments')
+                return []
+
             augments = []
 
             # Find augment sections by tier
@@ -72,6 +87,7 @@ class MetaTFTScraper(BaseScraper):
                         except:
                             continue
 
+            self.http_cache.mark_parsed(url)
             self.mark_fetched('augments')
             return augments
 
@@ -79,13 +95,20 @@ class MetaTFTScraper(BaseScraper):
             print(f"Failed to scrape augments: {e}")
             return self._get_fallback_augments()
 
-    def scrape_items(self):
+    def scrape_items(self, force=False):
         """Scrape item priority data"""
-        if not self.should_fetch('items'):
+        if not force and not self.should_fetch('items'):
             return []
 
         try:
-            soup = self.fetch_page(f"{self.BASE_URL}/items")
+            url = f"{self.base_url}/items"
+            soup = self.fetch_page(url, conditional=not force)
+
+            # Not modified since the last scrape: nothing to parse or save
+            if soup is None:
+                self.mark_fetched('items')
+                return []
+
             items = []
 
             item_rows = soup.find_all('tr', class_='item-row')
@@ -101,6 +124,7 @@ class MetaTFTScraper(BaseScraper):
                 except:
                     continue
 
+            self.http_cache.mark_parsed(url)
             self.mark_fetched('items')
             return items
 
@@ -1,4 +1,5 @@
 from .metatft_scraper import MetaTFTScraper
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 import json
 import os
@@ -6,9 +7,9 @@ import os
 class ScrapingOrchestrator:
     """Orchestrates all web scraping activities"""
 
-    def __init__(self, db_manager):
+    def __init__(self, db_manager, scraper=None):
         self.db = db_manager
-        self.metatft = MetaTFTScraper()
+        self.metatft = scraper or MetaTFTScraper()
         self.cache_file = 'data/scraper_cache.json'
         self.last_update_file = 'data/last_update.json'
 
@@ -20,39 +21,57 @@ class ScrapingOrchestrator:
 
         print("Starting data update...")
 
+        # Scrape all pages concurrently; database writes stay on this thread
+        print("Scraping compositions, augments and items...")
+        with ThreadPoolExecutor(max_workers=3, thread_name_prefix="scrape") as pool:
+            comps_future = pool.submit(self.metatft.scrape_compositions, force)
+            augments_future = pool.submit(self.metatft.scrape_augments, force)
+            items_future = pool.submit(self.metatft.scrape_items, force)
+
+            comps = comps_future.result()
+            augments = augments_future.result()
+            items = items_future.result()
+
         # Update compositions
-        print("Scraping compositions...")
-        comps = self.metatft.scrape_compositions()
         for comp in comps:
-            try:
-                comp['patch'] = 'current'
-                self.db.upsert_composition(comp)
-            except Exception as e:
-                print(f"Failed to save comp {comp.get('name')}: {e}")
+            comp['patch'] = 'current'
+        self._save("compositions", self.db.bulk_upsert_compositions, comps)
 
         # Update augments
-        print("Scraping augments...")
-        augments = self.metatft.scrape_augments()
-        for aug in augments:
-            try:
-                self.db.upsert_augment(aug)
-            except Exception as e:
-                print(f"Failed to save augment {aug.get('name')}: {e}")
+        self._save("augments", self.db.bulk_upsert_augments, augments)
 
         # Update items
-        print("Scraping items...")
-        items = self.metatft.scrape_items()
-        for item in items:
-            try:
-                self.db.upsert_item(item)
-            except Exception as e:
-                print(f"Failed to save item {item.get('name')}: {e}")
+        self._save("items", self.db.bulk_upsert_items, items)
 
         # Mark update time
         self._mark_updated()
 
         print(f"Data update complete! Updated {len(comps)} comps, {len(augments)} augments, {len(items)} items.")
 
+    def _save(self, label, bulk_upsert, records):
+        """
+        Write one scrape's records in a single transaction
+
+        If the batch is rejected, the records are retried one per
+        transaction so a single bad record only loses itself.
+        """
+        try:
+            counts = bulk_upsert(records)
+        except Exception as e:
+            print(f"Bulk save of {label} failed ({e}), saving one by one")
+
+            counts = {'inserted': 0, 'updated': 0}
+            for record in records:
+                try:
+                    result = bulk_upsert([record])
+                except Exception as e:
+                    print(f"Skipped {label} record {record.get('name', '?')}: {e}")
+                    continue
+                counts['inserted'] += result['inserted']
+                counts['updated'] += result['updated']
+
+        print(f"Saved {label}: {counts['inserted']} new, {counts['updated']} updated")
+
     def _should_update(self):
         """Check if we should update based on last update time"""
         if not os.path.exists(self.last_update_file):
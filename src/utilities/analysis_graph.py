@@ -0,0 +1,78 @@
+import copy
+
+class AnalysisGraph:
+    """
+    Dependency-tracked, memoized analysis sections
+
+    Each node declares the GameState fields it reads and the nodes it
+    builds on. run() diffs the game state against the previous run and
+    recomputes only nodes whose fields changed or whose upstream nodes were
+    recomputed; every other node returns its memoized output. Nodes must be
+    added after the nodes they depend on.
+    """
+
+    def __init__(self):
+        self.nodes = {}
+        self.values = {}
+        self.last_snapshot = {}
+        self.last_recomputed = []
+
+    def add_node(self, name, compute, fields=(), depends_on=()):
+        """
+        Register an analysis section
+
+        Args:
+            name: Node name
+            compute: Called as compute(game_state, *dependency outputs)
+            fields: GameState attributes the node reads
+            depends_on: Names of previously added nodes whose outputs it uses
+        """
+        for dependency in depends_on:
+            if dependency not in self.nodes:
+                raise ValueError(f"Unknown dependency '{dependency}' for node '{name}'")
+
+        self.nodes[name] = {
+            "compute": compute,
+            "fields": tuple(fields),
+            "depends_on": tuple(depends_on)
+        }
+        self.values.pop(name, None)
+
+    def run(self, game_state):
+        """
+        Bring every node up to date with the game state
+
+        Returns:
+            Dict of node name -> output
+        """
+        fields = {field for node in self.nodes.values() for field in node["fields"]}
+        snapshot = {field: copy.deepcopy(getattr(game_state, field)) for field in fields}
+        changed = {field for field in fields if field not in self.last_snapshot or snapshot[field] != self.last_snapshot[field]}
+
+        recomputed = []
+        for name, node in self.nodes.items():
+            dirty = (
+                name not in self.values or
+                any(field in changed for field in node["fields"]) or
+                any(dependency in recomputed for dependency in node["depends_on"])
+            )
+            if dirty:
+                inputs = [self.values[dependency] for dependency in node["depends_on"]]
+                self.values[name] = node["compute"](game_state, *inputs)
+                recomputed.append(name)
+
+        self.last_snapshot = snapshot
+        self.last_recomputed = recomputed
+
+        return dict(self.values)
+
+    def invalidate(self, name=None):
+        """Force a node (or every node) to recompute on the next run"""
+        if name is None:
+            self.values.clear()
+        else:
+            self.values.pop(name, None)
+
+    def get_last_recomputed(self):
+        """Names of the nodes recomputed by the last run, in run order"""
+        return list(self.last_recomputed)
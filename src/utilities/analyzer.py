@@ -1,10 +1,13 @@
 import json
+if __package__:
+    from .rule_engine import RuleEngine
+else:
+    from rule_engine import RuleEngine
 
 class Analyzer:
     def __init__(self):
-        # Load configuration
-        with open('config.json', 'r') as f:
-            self.config = json.load(f)
+        # Load configuration (rules are compiled once and re-evaluated incrementally)
+        self.rule_engine = RuleEngine('config.json')
         
         # Load unit data
         with open('units.json', 'r') as f:
@@ -15,9 +18,7 @@ class Analyzer:
         recommendations = []
         
         # Check each rule in config
-        for rule in self.config["rules"]:
-            if self._evaluate_condition(rule["condition"], game_state):
-                recommendations.append(rule["recommendation"])
+        recommendations.extend(self.rule_engine.evaluate(game_state))
         
         # Generate final recommendation text
         if not recommendations:
@@ -48,43 +49,3 @@ class Analyzer:
             result += f"- Strong synergies: {', '.join(strong_synergies)}\n"
         
         return result
-    
-    def _evaluate_condition(self, condition, game_state):
-        """Evaluate a single condition against game state"""
-        field = condition["field"]
-        operator = condition["operator"]
-        value = condition["value"]
-        
-        # Get the actual value from game state
-        if field == "level":
-            actual = game_state.level
-        elif field == "gold":
-            actual = game_state.gold
-        elif field == "health":
-            actual = game_state.health
-        elif field == "stage":
-            actual = game_state.stage
-        elif field.startswith("synergy."):
-            synergy_name = field.split(".")[1]
-            actual = game_state.synergies.get(synergy_name, 0)
-        elif field == "shop_has":
-            # Special case: check if shop contains a unit
-            return value in game_state.available_shops
-        else:
-            return False
-        
-        # Apply operator
-        if operator == "gt":
-            return actual > value
-        elif operator == "gte":
-            return actual >= value
-        elif operator == "lt":
-            return actual < value
-        elif operator == "lte":
-            return actual <= value
-        elif operator == "eq":
-            return actual == value
-        elif operator == "contains":
-            return value in actual
-        
-        return False
\ No newline at end of file
@@ -1,13 +1,19 @@
 import json
-from web_scraper import DataManager
+if __package__:
+    from .web_scraper import DataManager
+    from .rule_engine import RuleEngine
+    from .analysis_graph import AnalysisGraph
+else:
+    from web_scraper import DataManager
+    from rule_engine import RuleEngine
+    from analysis_graph import AnalysisGraph
 
 class AnalyzerEnhanced:
     """Enhanced analyzer with web-scraped data integration"""
 
     def __init__(self):
-        # Load configuration
-        with open('config.json', 'r') as f:
-            self.config = json.load(f)
+        # Load configuration (rules are compiled once and re-evaluated incrementally)
+        self.rule_engine = RuleEngine('config.json')
 
         # Load unit data
         with open('units.json', 'r') as f:
@@ -22,19 +28,45 @@ class AnalyzerEnhanced:
             print(f"Could not load web data: {e}")
             self.has_web_data = False
 
+        # Analysis sections are memoized and only recomputed when their inputs change
+        self.graph = self._build_graph()
+
+    def _build_graph(self):
+        """Declare each analysis section and the GameState fields it reads"""
+        graph = AnalysisGraph()
+
+        graph.add_node("rules", self.rule_engine.evaluate,
+                       fields=("level", "gold", "health", "stage", "synergies", "available_shops"))
+        graph.add_node("gold", self._analyze_gold, fields=("gold", "level"))
+        graph.add_node("health", self._analyze_health, fields=("health",))
+        graph.add_node("synergies", self._analyze_synergies, fields=("synergies", "level"))
+
+        # Web data sections share one comp recommendation query
+        if self.has_web_data:
+            graph.add_node("comp_recs", self._get_comp_recs, fields=("current_board",))
+            graph.add_node("meta_recs", self._get_meta_recommendations,
+                           fields=("current_board", "health"), depends_on=("comp_recs",))
+            graph.add_node("comp_strength", self._analyze_comp_strength,
+                           fields=("current_board",), depends_on=("comp_recs",))
+
+        return graph
+
     def analyze(self, game_state):
         """Enhanced analysis with meta recommendations"""
         recommendations = []
 
+        # Rules edited in config.json must show up even if the state didn't change
+        if self.rule_engine.reload_if_changed():
+            self.graph.invalidate("rules")
+
+        sections = self.graph.run(game_state)
+
         # 1. Rule-based recommendations
-        for rule in self.config["rules"]:
-            if self._evaluate_condition(rule["condition"], game_state):
-                recommendations.append(rule["recommendation"])
+        recommendations.extend(sections["rules"])
 
         # 2. Meta composition recommendations (web data)
         if self.has_web_data and game_state.current_board:
-            meta_recs = self._get_meta_recommendations(game_state)
-            recommendations.extend(meta_recs)
+            recommendations.extend(sections["meta_recs"])
 
         # 3. Generate final text
         if not recommendations:
@@ -49,29 +81,36 @@ class AnalyzerEnhanced:
         result += "\n=== Detailed Analysis ===\n"
 
         # Gold management
-        result += self._analyze_gold(game_state)
+        result += sections["gold"]
 
         # Health status
-        result += self._analyze_health(game_state)
+        result += sections["health"]
 
         # Synergy analysis
-        result += self._analyze_synergies(game_state)
+        result += sections["synergies"]
 
         # Composition strength (web data)
         if self.has_web_data:
-            result += self._analyze_comp_strength(game_state)
+            result += sections["comp_strength"]
 
         return result
 
-    def _get_meta_recommendations(self, game_state):
-        """Get recommendations based on current meta"""
-        recs = []
+    def get_last_recomputed(self):
+        """Names of the analysis sections recomputed by the last analyze()"""
+        return self.graph.get_last_recomputed()
 
-        # Get current units
+    def _get_comp_recs(self, game_state):
+        """Query the meta comp matches for the board once per board change"""
         current_units = [u.get('unit', '') for u in game_state.current_board]
 
-        # Get comp recommendations
-        comp_recs = self.data_manager.get_comp_recommendation(current_units)
+        if not current_units:
+            return []
+
+        return self.data_manager.get_comp_recommendation(current_units)
+
+    def _get_meta_recommendations(self, game_state, comp_recs):
+        """Get recommendations based on current meta"""
+        recs = []
 
         if comp_recs:
             # Top recommendation
@@ -172,7 +211,7 @@ class AnalyzerEnhanced:
 
         return analysis
 
-    def _analyze_comp_strength(self, game_state):
+    def _analyze_comp_strength(self, game_state, comp_recs):
         """Analyze composition strength using web data"""
         analysis = "\nComposition Strength:\n"
 
@@ -181,9 +220,7 @@ class AnalyzerEnhanced:
         if not current_units:
             return analysis
 
-        # Get meta comp matches
-        comp_recs = self.data_manager.get_comp_recommendation(current_units)
-
+        # Meta comp matches
         if comp_recs:
             top_match = comp_recs[0]
             completion = (top_match['matches'] / len(top_match['comp'].split())) * 100
@@ -207,51 +244,13 @@ class AnalyzerEnhanced:
 
         return analysis
 
-    def _evaluate_condition(self, condition, game_state):
-        """Evaluate a single condition against game state"""
-        field = condition["field"]
-        operator = condition["operator"]
-        value = condition["value"]
-
-        # Get actual value from game state
-        if field == "level":
-            actual = game_state.level
-        elif field == "gold":
-            actual = game_state.gold
-        elif field == "health":
-            actual = game_state.health
-        elif field == "stage":
-            actual = game_state.stage
-        elif field.startswith("synergy."):
-            synergy_name = field.split(".")[1]
-            actual = game_state.synergies.get(synergy_name, 0)
-        elif field == "shop_has":
-            return value in game_state.available_shops
-        else:
-            return False
-
-        # Apply operator
-        if operator == "gt":
-            return actual > value
-        elif operator == "gte":
-            return actual >= value
-        elif operator == "lt":
-            return actual < value
-        elif operator == "lte":
-            return actual <= value
-        elif operator == "eq":
-            return actual == value
-        elif operator == "contains":
-            return value in actual
-
-        return False
-
     def update_web_data(self):
         """Force update web-scraped data"""
         try:
             self.data_manager.scraper.update_all_data()
             self.data_manager.load_data()
             self.has_web_data = True
+            self.graph = self._build_graph()
             return "Data updated successfully"
         except Exception as e:
             return f"Update failed: {e}"
@@ -1,25 +1,81 @@
+import functools
+import queue
 import threading
 import time
-from screen_capture import ScreenCapture
-from ocr_reader import OCRReader
-from board_detector import BoardDetector
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+if __package__:
+    from .screen_capture import ScreenCapture
+    from .ocr_reader import OCRReader
+    from .board_detector import BoardDetector
+    from .change_detector import ChangeDetector
+    from .phase_scheduler import PhaseScheduler
+else:
+    from screen_capture import ScreenCapture
+    from ocr_reader import OCRReader
+    from board_detector import BoardDetector
+    from change_detector import ChangeDetector
+    from phase_scheduler import PhaseScheduler
+
+HUD_FIELDS = ("level", "gold", "health", "stage")
 
 class AutoUpdater:
-    """Phase 4: Real-time automatic game state updates"""
+    """
+    Phase 4: Real-time automatic game state updates
+
+    Runs as a pipeline of threads joined by single-slot queues:
+
+        capture -> vision/OCR -> state merge -> analysis/callback
+
+    Each queue keeps only the newest item, so a slow stage drops stale
+    frames instead of building a backlog, and throughput is bounded by the
+    slowest stage rather than the sum of all stages. What gets captured and
+    how often is decided per region group by a PhaseScheduler.
+    """
+
+    STAGES = ("capture", "vision", "merge", "callback")
+
+    # Scheduler group each capture region belongs to
+    REGION_GROUPS = {
+        "level": "hud",
+        "gold": "hud",
+        "health": "hud",
+        "stage": "hud",
+        "shop": "shop"
+    }
 
     def __init__(self, game_state, update_callback=None):
         self.game_state = game_state
         self.update_callback = update_callback
         self.running = False
-        self.thread = None
+        self.threads = []
+
+        # Set to stop the current pipeline; every start() gets a fresh one
+        # so threads of a pipeline that outlived stop() never resume
+        self.stop_event = None
 
         # Initialize components
         self.screen_capture = ScreenCapture()
         self.ocr_reader = OCRReader()
         self.board_detector = BoardDetector()
+        self.change_detector = ChangeDetector()
+        self.scheduler = PhaseScheduler()
 
-        # Update interval in seconds
-        self.update_interval = 3.0
+        # HUD poll interval in seconds while planning, in combat or with no stage read
+        # (the scheduler's default until set_update_interval is called)
+        self.update_interval = self.scheduler.intervals["planning"]["hud"]
+
+        # Regions grabbed each cycle (resolved lazily from the monitor size)
+        self.capture_regions = None
+
+        # Workers per pipeline for per-region vision/OCR work within one frame
+        self.vision_workers = 4
+
+        # Guards game_state against concurrent merge and reader threads
+        self.state_lock = threading.Lock()
+
+        self.stats_lock = threading.Lock()
+        self._reset_stats()
 
     def start(self):
         """Start automatic updates"""
@@ -27,63 +83,275 @@ class AutoUpdater:
             return
 
         self.running = True
-        self.thread = threading.Thread(target=self._update_loop, daemon=True)
-        self.thread.start()
+        self._reset_stats()
+
+        stop_event = threading.Event()
+        self.stop_event = stop_event
+
+        # Owned by this pipeline's vision thread, which shuts it down on exit
+        vision_pool = ThreadPoolExecutor(max_workers=self.vision_workers, thread_name_prefix="vision")
+        process_frame = functools.partial(self._process_frame, pool=vision_pool)
+
+        frames = queue.Queue(maxsize=1)
+        readings = queue.Queue(maxsize=1)
+        updates = queue.Queue(maxsize=1)
 
-    def stop(self):
-        """Stop automatic updates"""
+        self.threads = [
+            threading.Thread(target=self._capture_loop, args=(stop_event, frames), daemon=True),
+            threading.Thread(target=self._stage_loop, args=(stop_event, "vision", frames, process_frame, readings, vision_pool.shutdown), daemon=True),
+            threading.Thread(target=self._stage_loop, args=(stop_event, "merge", readings, self._merge_results, updates), daemon=True),
+            threading.Thread(target=self._stage_loop, args=(stop_event, "callback", updates, self._notify, None), daemon=True),
+        ]
+        for thread in self.threads:
+            thread.start()
+
+    def stop(self, timeout=2.0):
+        """
+        Stop automatic updates
+
+        Args:
+            timeout: Seconds to wait for each pipeline thread; threads
+                still busy after that finish their current item and exit
+                on their own, without picking up new work
+        """
         self.running = False
-        if self.thread:
-            self.thread.join(timeout=2.0)
+        if self.stop_event:
+            self.stop_event.set()
+            self.stop_event = None
+
+        for thread in self.threads:
+            thread.join(timeout=timeout)
+        self.threads = []
+
+    def _capture_loop(self, stop_event, output):
+        """Stage 1: grab the region groups the scheduler says are due"""
+        while not stop_event.is_set():
+            started = time.perf_counter()
+
+            # Re-evaluate the phase as the merged stage and clock move on
+            with self.state_lock:
+                stage = self.game_state.stage
+            self.scheduler.observe(stage)
+
+            groups = self.scheduler.due_groups()
+
+            if groups:
+                try:
+                    frame = self._capture_frame(groups)
+                    if frame:
+                        self._offer(output, frame, "capture")
+                except Exception as e:
+                    print(f"Auto-update error: {e}")
 
-    def _update_loop(self):
-        """Main update loop running in background thread"""
-        while self.running:
+                self._record("capture", time.perf_counter() - started)
+
+            # Cap the sleep so a stop() is noticed promptly
+            stop_event.wait(min(self.scheduler.next_due_in(), 0.5))
+
+    def _stage_loop(self, stop_event, name, source, handler, output, on_exit=None):
+        """Generic stage: take the newest item, process it, pass it on"""
+        try:
+            while not stop_event.is_set():
+                try:
+                    item = source.get(timeout=0.25)
+                except queue.Empty:
+                    continue
+
+                started = time.perf_counter()
+                try:
+                    result = handler(item)
+                    if result is not None and output is not None and not stop_event.is_set():
+                        self._offer(output, result, name)
+                except Exception as e:
+                    print(f"Auto-update error ({name}): {e}")
+
+                self._record(name, time.perf_counter() - started)
+        finally:
+            if on_exit:
+                on_exit()
+
+    def _offer(self, target, item, stage):
+        """Put into a single-slot queue, replacing a stale item if present"""
+        while True:
             try:
-                self._perform_update()
-            except Exception as e:
-                print(f"Auto-update error: {e}")
-
-            time.sleep(self.update_interval)
-
-    def _perform_update(self):
-        """Perform a single update cycle"""
-        # Capture screen
-        img = self.screen_capture.capture_full_screen()
-
-        # Extract stats via OCR
-        stats = self.ocr_reader.read_game_stats(img)
-
-        # Update game state if valid data detected
-        if stats['level'] > 0:
-            self.game_state.level = stats['level']
-            self.game_state.gold = stats['gold']
-            self.game_state.health = stats['health']
-            self.game_state.stage = stats['stage']
-
-            # Try to detect board composition
-            regions = self.board_detector.get_board_region_coords()
-
-            # Detect units in shop
-            shop_region = regions['shop']
-            shop_img = img.crop((
-                shop_region['left'],
-                shop_region['top'],
-                shop_region['left'] + shop_region['width'],
-                shop_region['top'] + shop_region['height']
-            ))
-
-            shop_units = self.ocr_reader.detect_shop_units(shop_img)
-            if shop_units:
-                self.game_state.available_shops = shop_units
-
-            # Notify callback if provided
-            if self.update_callback:
-                self.update_callback()
+                target.put_nowait(item)
+                return
+            except queue.Full:
+                try:
+                    stale = target.get_nowait()
+                except queue.Empty:
+                    continue
+
+                self._merge_stale(item, stale, stage)
+
+                with self.stats_lock:
+                    self.stats["dropped"][stage] += 1
+
+    def _merge_stale(self, item, stale, stage):
+        """Fold what only the dropped item carried into its replacement"""
+        if stage == "capture":
+            # Keep regions and change flags from the dropped frame: the
+            # change detector has already moved its baseline past them
+            for region, roi in stale["rois"].items():
+                item["rois"].setdefault(region, roi)
+            for region, changed in stale["dirty"].items():
+                item["dirty"][region] = item["dirty"].get(region, False) or changed
+        else:
+            # Readings may cover only some groups; newer readings win
+            # unless they came back empty
+            if stale["hud"]:
+                hud = dict(stale["hud"])
+                for field, reading in (item["hud"] or {}).items():
+                    if reading.get("value") is not None or field not in hud:
+                        hud[field] = reading
+                item["hud"] = hud
+            if item["shop_units"] is None:
+                item["shop_units"] = stale["shop_units"]
+
+    def _capture_frame(self, groups):
+        """
+        Capture the regions of the given groups; None if nothing changed
+
+        Also feeds the scheduler its pixel probes and the latest stage.
+        """
+        now = time.time()
+        regions = {
+            name: region for name, region in self._get_capture_regions().items()
+            if self.REGION_GROUPS[name] in groups
+        }
+        self.scheduler.mark_polled(groups, now)
+        if not regions:
+            return None
+
+        rois = self.screen_capture.capture_regions(regions)
+
+        probes = {}
+        hud_rois = [rois[field] for field in HUD_FIELDS if field in rois]
+        if hud_rois:
+            probes["hud_brightness"] = float(np.mean([np.asarray(roi).mean() for roi in hud_rois]))
+        if "shop" in rois:
+            probes["shop_brightness"] = float(np.asarray(rois["shop"]).mean())
+
+        with self.state_lock:
+            stage = self.game_state.stage
+        self.scheduler.observe(stage, probes, now)
+
+        # Skip the cycle entirely if nothing on screen meaningfully changed
+        dirty = self.change_detector.update(rois)
+        if not any(dirty.values()):
+            return None
+
+        return {"rois": rois, "dirty": dirty, "captured_at": now}
+
+    def _process_frame(self, frame, pool=None):
+        """Stage 2: read the captured HUD boxes and shop concurrently"""
+        rois, dirty = frame["rois"], frame["dirty"]
+
+        # Read each HUD number box (unchanged boxes reuse the last reading)
+        hud_fields = {field: rois[field] for field in HUD_FIELDS if field in rois}
+
+        jobs = {}
+        if hud_fields:
+            jobs["hud"] = (self.ocr_reader.read_hud_fields, (hud_fields,), {"changed": dirty})
+        if "shop" in rois:
+            jobs["shop_units"] = (self.ocr_reader.detect_shop_units, (rois["shop"],), {"changed": dirty["shop"]})
+
+        if pool:
+            futures = {key: pool.submit(fn, *args, **kwargs) for key, (fn, args, kwargs) in jobs.items()}
+            results = {key: future.result() for key, future in futures.items()}
+        else:
+            results = {key: fn(*args, **kwargs) for key, (fn, args, kwargs) in jobs.items()}
+
+        return {
+            "hud": results.get("hud"),
+            "shop_units": results.get("shop_units"),
+            "captured_at": frame["captured_at"]
+        }
+
+    def _merge_results(self, readings):
+        """Stage 3: apply readings to the game state"""
+        hud = readings["hud"] or {}
+
+        with self.state_lock:
+            level = hud.get("level", {}).get("value")
+            if level:
+                self.game_state.level = level
+
+            # Update game state only once a valid level has been detected
+            if self.game_state.level <= 0:
+                return None
+
+            if hud.get("gold", {}).get("value") is not None:
+                self.game_state.gold = hud["gold"]["value"]
+            if hud.get("health", {}).get("value") is not None:
+                self.game_state.health = hud["health"]["value"]
+            if hud.get("stage", {}).get("value"):
+                self.game_state.stage = hud["stage"]["value"]
+
+            if readings["shop_units"]:
+                self.game_state.available_shops = readings["shop_units"]
+
+        return readings
+
+    def _notify(self, readings):
+        """Stage 4: notify the callback (analysis / UI)"""
+        if self.update_callback:
+            self.update_callback()
+
+        with self.stats_lock:
+            self.stats["latency"] = time.time() - readings["captured_at"]
+
+    def _get_capture_regions(self):
+        """Resolve the capture region map for the current screen resolution"""
+        if self.capture_regions is None:
+            resolution = self.screen_capture.get_screen_resolution()
+            regions = self.ocr_reader.get_hud_regions(resolution)
+            regions["shop"] = self.board_detector.get_board_region_coords(resolution)["shop"]
+            self.capture_regions = regions
+        return self.capture_regions
+
+    def _reset_stats(self):
+        with self.stats_lock:
+            self.stats = {
+                "runs": {stage: 0 for stage in self.STAGES},
+                "avg_ms": {stage: 0.0 for stage in self.STAGES},
+                "dropped": {stage: 0 for stage in self.STAGES},
+                "latency": None
+            }
+
+    def _record(self, stage, elapsed):
+        """Track a running average of stage time"""
+        with self.stats_lock:
+            runs = self.stats["runs"][stage] + 1
+            avg = self.stats["avg_ms"][stage]
+            self.stats["runs"][stage] = runs
+            self.stats["avg_ms"][stage] = avg + (elapsed * 1000 - avg) / runs
+
+    def get_pipeline_stats(self):
+        """
+        Get per-stage timings and drop counts
+
+        Returns:
+            dict with runs, avg_ms and dropped per stage, plus the latest
+            capture-to-callback latency in seconds
+        """
+        with self.stats_lock:
+            return {
+                "runs": dict(self.stats["runs"]),
+                "avg_ms": dict(self.stats["avg_ms"]),
+                "dropped": dict(self.stats["dropped"]),
+                "latency": self.stats["latency"]
+            }
 
     def set_update_interval(self, seconds):
-        """Change the update interval"""
+        """Change the HUD poll interval used while planning, in combat or with no stage read"""
         self.update_interval = max(1.0, seconds)  # Minimum 1 second
+        for phase in ("planning", "combat", "unknown"):
+            self.scheduler.set_interval(phase, "hud", self.update_interval)
+
+    def get_scheduler_decisions(self):
+        """Get the adaptive scheduler's current phase, reason and rates"""
+        return self.scheduler.get_decisions()
 
     def is_running(self):
         """Check if auto-updater is running"""
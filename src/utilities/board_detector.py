@@ -1,6 +1,10 @@
 import cv2
 import numpy as np
 from PIL import Image
+if __package__:
+    from .screen_capture import to_bgr
+else:
+    from screen_capture import to_bgr
 
 class BoardDetector:
     """Phase 3: Computer vision for board detection"""
@@ -14,14 +18,13 @@ class BoardDetector:
         Detect champion positions on the board using computer vision
 
         Args:
-            img: PIL Image or numpy array
+            img: PIL Image, CapturedFrame or numpy array
 
         Returns:
             List of detected unit positions
         """
         # Convert PIL to OpenCV format
-        if isinstance(img, Image.Image):
-            img = cv2.cvtColor(np.array(img), cv2.COLOR_RGB2BGR)
+        img = to_bgr(img)
 
         # Convert to HSV for better color detection
         hsv = cv2.cvtColor(img, cv2.COLOR_BGR2HSV)
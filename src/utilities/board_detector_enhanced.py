@@ -1,7 +1,12 @@
 import cv2
 import numpy as np
 from PIL import Image
-import pytesseract
+if __package__:
+    from .ocr_backend import get_ocr_backend
+    from .screen_capture import CapturedFrame, to_bgr
+else:
+    from ocr_backend import get_ocr_backend
+    from screen_capture import CapturedFrame, to_bgr
 
 class BoardDetectorEnhanced:
     """Enhanced Phase 3: Advanced computer vision for TFT board detection"""
@@ -11,6 +16,9 @@ class BoardDetectorEnhanced:
         self.bench_region = None
         self.shop_region = None
 
+        # Last detected state, reused for regions reported unchanged
+        self.last_state = {}
+
         # Calibration data (adjust per resolution)
         self.calibration = {
             "1920x1080": {
@@ -27,17 +35,20 @@ class BoardDetectorEnhanced:
             }
         }
 
-    def detect_board_state(self, img):
+    def detect_board_state(self, img, dirty_regions=None):
         """
         Comprehensive board state detection
 
+        Args:
+            img: PIL Image, CapturedFrame or OpenCV image of the full screen
+            dirty_regions: Optional dict of region name ("board", "bench",
+                "shop") -> changed flag, e.g. from ChangeDetector.update().
+                Clean regions reuse the previous detection.
+
         Returns:
             dict with units, bench, shop, stats
         """
-        if isinstance(img, Image.Image):
-            img_cv = cv2.cvtColor(np.array(img), cv2.COLOR_RGB2BGR)
-        else:
-            img_cv = img
+        img_cv = to_bgr(img)
 
         height, width = img_cv.shape[:2]
         resolution = f"{width}x{height}"
@@ -45,15 +56,23 @@ class BoardDetectorEnhanced:
         # Get calibrated regions or use defaults
         regions = self.calibration.get(resolution, self.calibration["1920x1080"])
 
-        result = {
-            "board_units": self.detect_board_units(img_cv, regions["board"]),
-            "bench_units": self.detect_bench_units(img_cv, regions["bench"]),
-            "shop_units": self.detect_shop_units(img_cv, regions["shop"]),
-            "unit_count": 0
+        detectors = {
+            "board_units": ("board", self.detect_board_units),
+            "bench_units": ("bench", self.detect_bench_units),
+            "shop_units": ("shop", self.detect_shop_units),
         }
 
+        result = {}
+        for key, (region_name, detect) in detectors.items():
+            clean = dirty_regions is not None and not dirty_regions.get(region_name, True)
+            if clean and key in self.last_state:
+                result[key] = self.last_state[key]
+            else:
+                result[key] = detect(img_cv, regions[region_name])
+
         result["unit_count"] = len(result["board_units"])
 
+        self.last_state = dict(result)
         return result
 
     def detect_board_units(self, img, region):
@@ -137,27 +156,31 @@ class BoardDetectorEnhanced:
 
         # Shop has 5 slots
         slot_width = w // 5
-        units = []
+        slot_images = []
 
         for i in range(5):
             slot_x = i * slot_width
             slot_roi = shop_roi[:, slot_x:slot_x+slot_width]
 
-            # Try OCR on champion name
-            try:
-                # Preprocess for OCR
-                gray = cv2.cvtColor(slot_roi, cv2.COLOR_BGR2GRAY)
-                _, thresh = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+            # Preprocess for OCR
+            gray = cv2.cvtColor(slot_roi, cv2.COLOR_BGR2GRAY)
+            _, thresh = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+            slot_images.append(thresh)
 
-                text = pytesseract.image_to_string(thresh, config='--psm 7').strip()
+        # OCR all champion names in one pass on the shared worker pool
+        try:
+            texts = get_ocr_backend().map(slot_images, config='--psm 7')
+        except Exception:
+            return []
 
-                if text and len(text) > 2:
-                    units.append({
-                        "slot": i,
-                        "name": text
-                    })
-            except:
-                pass
+        units = []
+        for i, text in enumerate(texts):
+            text = text.strip()
+            if text and len(text) > 2:
+                units.append({
+                    "slot": i,
+                    "name": text
+                })
 
         return units
 
@@ -231,10 +254,7 @@ class BoardDetectorEnhanced:
         Returns:
             PIL Image with annotations
         """
-        if isinstance(img, Image.Image):
-            img_cv = cv2.cvtColor(np.array(img), cv2.COLOR_RGB2BGR)
-        else:
-            img_cv = img.copy()
+        img_cv = to_bgr(img).copy()
 
         # Draw board units
         for unit in detections.get("board_units", []):
@@ -260,7 +280,7 @@ class BoardDetectorEnhanced:
 
     def calibrate_for_resolution(self, img):
         """Auto-detect regions for current resolution"""
-        if isinstance(img, Image.Image):
+        if isinstance(img, (Image.Image, CapturedFrame)):
             width, height = img.size
         else:
             height, width = img.shape[:2]
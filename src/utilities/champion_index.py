@@ -0,0 +1,158 @@
+import os
+import cv2
+import numpy as np
+
+class ChampionFeatureIndex:
+    """
+    Nearest-neighbor index over champion template feature vectors
+
+    Each template is reduced to a short descriptor (hue/saturation
+    histogram plus a downsampled grayscale thumbnail). Queries score all
+    rows with one matrix-vector product and return the top-k, so lookup
+    cost stays flat as the template library grows into the thousands.
+    """
+
+    # Bump when the descriptor changes so stale persisted vectors are rebuilt
+    FEATURE_VERSION = 1
+
+    HIST_BINS = (16, 4)       # hue x saturation bins
+    THUMBNAIL_SIZE = (16, 16)
+
+    def __init__(self):
+        self.labels = []
+        self.paths = []
+        self.matrix = None
+        self._rows = []
+
+    def __len__(self):
+        return len(self.labels)
+
+    def extract_features(self, img):
+        """
+        Compute the descriptor of a champion image
+
+        Args:
+            img: BGR numpy array
+
+        Returns:
+            Unit-norm float32 feature vector
+        """
+        hsv = cv2.cvtColor(img, cv2.COLOR_BGR2HSV)
+        hist = cv2.calcHist([hsv], [0, 1], None, list(self.HIST_BINS), [0, 180, 0, 256])
+        hist = np.sqrt(hist.ravel() / max(hist.sum(), 1))  # Hellinger mapping
+
+        gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+        thumb = cv2.resize(gray, self.THUMBNAIL_SIZE, interpolation=cv2.INTER_AREA).astype(np.float32).ravel()
+        thumb -= thumb.mean()
+        thumb_norm = np.linalg.norm(thumb)
+        if thumb_norm > 0:
+            thumb /= thumb_norm
+
+        features = np.concatenate([hist, thumb]).astype(np.float32)
+        norm = np.linalg.norm(features)
+        return features / norm if norm > 0 else features
+
+    def add(self, label, features, path=None):
+        """
+        Add a precomputed feature vector to the index
+
+        Args:
+            label: Champion name
+            features: Vector from extract_features()
+            path: Template file the vector came from
+        """
+        self.labels.append(label)
+        self.paths.append(path)
+        self._rows.append(np.asarray(features, dtype=np.float32))
+        self.matrix = None
+
+    def clear(self):
+        """Remove all entries"""
+        self.labels = []
+        self.paths = []
+        self._rows = []
+        self.matrix = None
+
+    def query(self, img, k=5):
+        """
+        Find the k templates most similar to an image
+
+        Args:
+            img: BGR numpy array
+            k: Number of neighbors to return
+
+        Returns:
+            List of (row index, label, score) sorted by descending score
+        """
+        if not self.labels:
+            return []
+
+        scores = self._get_matrix() @ self.extract_features(img)
+        k = min(k, len(scores))
+
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+
+        return [(int(i), self.labels[i], float(scores[i])) for i in top]
+
+    def query_batch(self, images, k=5):
+        """
+        Find the k nearest templates for several images in one pass
+
+        Args:
+            images: List of BGR numpy arrays
+            k: Number of neighbors per image
+
+        Returns:
+            (n_images, k) array of row indices, best first
+        """
+        features = np.stack([self.extract_features(img) for img in images])
+        scores = features @ self._get_matrix().T
+        k = min(k, scores.shape[1])
+
+        top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        order = np.argsort(-np.take_along_axis(scores, top, axis=1), axis=1)
+        return np.take_along_axis(top, order, axis=1)
+
+    def _get_matrix(self):
+        """Stack the feature rows into a matrix (cached until the next add)"""
+        if self.matrix is None:
+            self.matrix = np.stack(self._rows)
+        return self.matrix
+
+    def save_to_db(self, db_manager):
+        """Persist every feature vector into ChampionTemplate.histogram_data"""
+        for label, path, row in zip(self.labels, self.paths, self._rows):
+            db_manager.upsert_champion_template(label, path, {
+                "version": self.FEATURE_VERSION,
+                "mtime": self._file_mtime(path),
+                "features": row.tolist()
+            })
+
+    def load_from_db(self, db_manager):
+        """
+        Load persisted feature vectors
+
+        Returns:
+            Dict of template path -> (label, features) for rows that match the
+            current descriptor version and template file
+        """
+        stored = {}
+        for template in db_manager.get_champion_templates():
+            path = template.get("template_path")
+            data = template.get("histogram_data") or {}
+
+            if not path or data.get("version") != self.FEATURE_VERSION:
+                continue
+            if data.get("mtime") != self._file_mtime(path):
+                continue
+
+            stored[path] = (template["champion"], np.asarray(data["features"], dtype=np.float32))
+
+        return stored
+
+    def _file_mtime(self, path):
+        """Modification time of a template file (None if missing)"""
+        if path and os.path.exists(path):
+            return os.path.getmtime(path)
+        return None
@@ -2,7 +2,16 @@ import cv2
 import numpy as np
 from PIL import Image
 import os
-import pytesseract
+import time
+from concurrent.futures import ThreadPoolExecutor
+if __package__:
+    from .ocr_backend import get_ocr_backend
+    from .champion_index import ChampionFeatureIndex
+    from .screen_capture import to_bgr
+else:
+    from ocr_backend import get_ocr_backend
+    from champion_index import ChampionFeatureIndex
+    from screen_capture import to_bgr
 
 class ChampionRecognizer:
     """
@@ -14,13 +23,38 @@ class ChampionRecognizer:
     3. Color histogram matching
     """
 
-    def __init__(self, templates_dir="champion_templates"):
+    # Size every template and ROI is normalized to before matching
+    TEMPLATE_SIZE = (64, 64)
+
+    def __init__(self, templates_dir="champion_templates", db_manager=None):
         self.templates_dir = templates_dir
+        self.db = db_manager
         self.templates = {}
+
+        # Every template file (variants included) as (champion, path, image)
+        self.template_entries = []
+
+        # Stacked template bank: one zero-mean, unit-norm row per entry
+        self.template_names = []
+        self.template_matrix = None
+
+        # Feature index used to shortlist candidates on large libraries
+        self.feature_index = ChampionFeatureIndex()
+        self.index_min_templates = 64
+        self.index_candidates = 16
+
+        # Workers for the OCR/color fallback in batch_recognize
+        self.fallback_workers = 4
+
         self.load_templates()
 
     def load_templates(self):
-        """Load champion portrait templates"""
+        """
+        Load champion portrait templates
+
+        Templates are either <templates_dir>/<Champion>.png or, for star
+        levels and skins, any image inside <templates_dir>/<Champion>/.
+        """
         if not os.path.exists(self.templates_dir):
             os.makedirs(self.templates_dir)
             print(f"Champion templates directory created: {self.templates_dir}")
@@ -28,16 +62,74 @@ class ChampionRecognizer:
             return
 
         # Load all templates
-        for filename in os.listdir(self.templates_dir):
-            if filename.endswith(('.png', '.jpg')):
-                champ_name = os.path.splitext(filename)[0]
-                template_path = os.path.join(self.templates_dir, filename)
+        for filename in sorted(os.listdir(self.templates_dir)):
+            path = os.path.join(self.templates_dir, filename)
+
+            if os.path.isdir(path):
+                for variant in sorted(os.listdir(path)):
+                    if variant.endswith(('.png', '.jpg')):
+                        self._add_template(filename, os.path.join(path, variant))
+            elif filename.endswith(('.png', '.jpg')):
+                self._add_template(os.path.splitext(filename)[0], path)
 
-                template = cv2.imread(template_path)
-                if template is not None:
-                    self.templates[champ_name] = template
+        self._build_template_bank()
 
-        print(f"Loaded {len(self.templates)} champion templates")
+        print(f"Loaded {len(self.template_entries)} champion templates")
+
+    def _add_template(self, champ_name, template_path):
+        """Read one template file into the library"""
+        template = cv2.imread(template_path)
+        if template is not None:
+            self.templates.setdefault(champ_name, template)
+            self.template_entries.append((champ_name, template_path, template))
+
+    def _build_template_bank(self):
+        """Normalize all templates once into a single float32 matrix and index"""
+        self.template_names = [name for name, _, _ in self.template_entries]
+
+        if not self.template_names:
+            self.template_matrix = None
+            return
+
+        self.template_matrix = np.stack([
+            self._template_vector(template) for _, _, template in self.template_entries
+        ])
+
+        self._build_feature_index()
+
+    def _build_feature_index(self):
+        """Build the feature index, reusing vectors persisted in the database"""
+        stored = self.feature_index.load_from_db(self.db) if self.db else {}
+
+        self.feature_index.clear()
+        computed = False
+        for name, path, template in self.template_entries:
+            if path in stored and stored[path][0] == name:
+                features = stored[path][1]
+            else:
+                features = self.feature_index.extract_features(template)
+                computed = True
+            self.feature_index.add(name, features, path)
+
+        if self.db and computed:
+            try:
+                self.feature_index.save_to_db(self.db)
+            except Exception as e:
+                print(f"Could not persist template features: {e}")
+
+    def _template_vector(self, img):
+        """
+        Flatten an image into a zero-mean, unit-norm vector
+
+        The dot product of two such vectors equals cv2.matchTemplate's
+        TM_CCOEFF_NORMED score for two equally sized images.
+        """
+        resized = cv2.resize(img, self.TEMPLATE_SIZE).astype(np.float32)
+        centered = resized - resized.mean(axis=(0, 1))
+
+        vector = centered.ravel()
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
 
     def recognize_champion(self, unit_roi):
         """
@@ -49,10 +141,7 @@ class ChampionRecognizer:
         Returns:
             str: Champion name or "Unknown"
         """
-        if isinstance(unit_roi, Image.Image):
-            unit_cv = cv2.cvtColor(np.array(unit_roi), cv2.COLOR_RGB2BGR)
-        else:
-            unit_cv = unit_roi
+        unit_cv = to_bgr(unit_roi)
 
         # Method 1: Template matching
         if self.templates:
@@ -60,39 +149,66 @@ class ChampionRecognizer:
             if template_match:
                 return template_match
 
+        return self._fallback_match(unit_cv)[0]
+
+    def _fallback_match(self, img):
+        """
+        Recognize without templates
+
+        Returns:
+            (champion name or "Unknown", method used)
+        """
         # Method 2: OCR (if champion name is visible)
-        ocr_match = self._ocr_match(unit_cv)
+        ocr_match = self._ocr_match(img)
         if ocr_match:
-            return ocr_match
+            return ocr_match, "ocr"
 
         # Method 3: Color histogram matching
-        color_match = self._color_match(unit_cv)
+        color_match = self._color_match(img)
         if color_match:
-            return color_match
+            return color_match, "color"
 
-        return "Unknown"
+        return "Unknown", None
 
     def _template_match(self, img):
         """Match using template matching"""
-        best_match = None
-        best_score = 0.6  # Minimum confidence threshold
+        return self._match_templates([img])[0]
 
-        # Resize image to standard size
-        img_resized = cv2.resize(img, (64, 64))
+    def _match_templates(self, images):
+        """
+        Template-match several images in one vectorized pass
+
+        Args:
+            images: List of BGR numpy arrays
 
-        for champ_name, template in self.templates.items():
-            # Resize template to match
-            template_resized = cv2.resize(template, (64, 64))
+        Returns:
+            List of champion names (None where no template scored high enough)
+        """
+        min_score = 0.6  # Minimum confidence threshold
 
-            # Template matching
-            result = cv2.matchTemplate(img_resized, template_resized, cv2.TM_CCOEFF_NORMED)
-            _, max_val, _, _ = cv2.minMaxLoc(result)
+        if self.template_matrix is None or not images:
+            return [None] * len(images)
 
-            if max_val > best_score:
-                best_score = max_val
-                best_match = champ_name
+        vectors = np.stack([self._template_vector(img) for img in images])
 
-        return best_match
+        if len(self.template_entries) >= self.index_min_templates:
+            # Large library: only verify each image's nearest candidates exactly
+            rows = self.feature_index.query_batch(images, k=self.index_candidates)
+            scores = np.einsum('nkd,nd->nk', self.template_matrix[rows], vectors)
+        else:
+            # Score every image against every template in one matrix product
+            rows = None
+            scores = vectors @ self.template_matrix.T
+
+        best = scores.argmax(axis=1)
+        best_scores = scores[np.arange(len(images)), best]
+        if rows is not None:
+            best = rows[np.arange(len(images)), best]
+
+        return [
+            self.template_names[row] if score > min_score else None
+            for row, score in zip(best, best_scores)
+        ]
 
     def _ocr_match(self, img):
         """Match using OCR on champion name text"""
@@ -104,7 +220,7 @@ class ChampionRecognizer:
             _, thresh = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
 
             # OCR
-            text = pytesseract.image_to_string(thresh, config='--psm 7').strip()
+            text = get_ocr_backend().image_to_string(thresh, config='--psm 7').strip()
 
             # Clean up text
             text = ''.join(c for c in text if c.isalpha())
@@ -178,10 +294,7 @@ class ChampionRecognizer:
             unit_position: (x, y, w, h) of champion unit
             champion_name: Name to save template as
         """
-        if isinstance(screenshot, Image.Image):
-            img = cv2.cvtColor(np.array(screenshot), cv2.COLOR_RGB2BGR)
-        else:
-            img = screenshot
+        img = to_bgr(screenshot)
 
         x, y, w, h = unit_position
         unit_roi = img[y:y+h, x:x+w]
@@ -192,26 +305,62 @@ class ChampionRecognizer:
 
         # Reload templates
         self.templates[champion_name] = unit_roi
+        self.template_entries = [e for e in self.template_entries if e[1] != template_path]
+        self.template_entries.append((champion_name, template_path, unit_roi))
+        self._build_template_bank()
 
         print(f"Saved template for {champion_name}")
 
-    def batch_recognize(self, unit_rois):
+    def batch_recognize(self, unit_rois, return_details=False):
         """
         Recognize multiple champions at once
 
+        All ROIs are template-matched in one vectorized pass; only the ones
+        left unresolved go to the OCR/color fallback, which runs on a thread
+        pool instead of one unit after another.
+
         Args:
             unit_rois: List of unit ROI images
+            return_details: Return per-unit dicts with method and timing
 
         Returns:
-            List of champion names
+            List of champion names in input order, or with return_details
+            a list of dicts with champion, method and elapsed_ms
         """
-        champions = []
+        rois = [to_bgr(roi) for roi in unit_rois]
+        if not rois:
+            return []
+
+        # Stage 1: vectorized template matching, cost shared across units
+        start = time.perf_counter()
+        matches = self._match_templates(rois) if self.templates else [None] * len(rois)
+        shared_ms = (time.perf_counter() - start) * 1000 / len(rois)
 
-        for roi in unit_rois:
-            champ = self.recognize_champion(roi)
-            champions.append(champ)
+        details = [{
+            "champion": match,
+            "method": "template" if match else None,
+            "elapsed_ms": shared_ms
+        } for match in matches]
 
-        return champions
+        # Stage 2: pooled fallback for the unresolved units only
+        unresolved = [i for i, match in enumerate(matches) if match is None]
+
+        def fallback(index):
+            start = time.perf_counter()
+            champion, method = self._fallback_match(rois[index])
+            return index, champion, method, (time.perf_counter() - start) * 1000
+
+        if unresolved:
+            with ThreadPoolExecutor(max_workers=self.fallback_workers) as pool:
+                for index, champion, method, elapsed in pool.map(fallback, unresolved):
+                    details[index]["champion"] = champion
+                    details[index]["method"] = method
+                    details[index]["elapsed_ms"] += elapsed
+
+        if return_details:
+            return details
+
+        return [detail["champion"] for detail in details]
 
 
 class ItemRecognizer:
@@ -232,10 +381,7 @@ class ItemRecognizer:
         Returns:
             List of item names (max 3)
         """
-        if isinstance(unit_roi, Image.Image):
-            img = cv2.cvtColor(np.array(unit_roi), cv2.COLOR_RGB2BGR)
-        else:
-            img = unit_roi
+        img = to_bgr(unit_roi)
 
         # Items appear as small icons on the unit
         # Typically bottom-left of unit portrait
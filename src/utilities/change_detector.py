@@ -0,0 +1,80 @@
+import cv2
+import numpy as np
+if __package__:
+    from .screen_capture import to_bgr
+else:
+    from screen_capture import to_bgr
+
+class ChangeDetector:
+    """
+    Frame differencing for the auto-update pipeline
+
+    Each region is reduced to a small grayscale fingerprint and compared
+    against the fingerprint from the last time it was considered changed.
+    Regions whose pixels have not meaningfully moved are reported clean so
+    OCR and board detection can be skipped for them.
+    """
+
+    def __init__(self, fingerprint_size=(32, 16), pixel_delta=24, changed_fraction=0.02):
+        # (width, height) of the downsampled fingerprint
+        self.fingerprint_size = fingerprint_size
+
+        # A fingerprint cell counts as changed if it moved more than this
+        self.pixel_delta = pixel_delta
+
+        # A region is dirty once this fraction of its cells changed
+        self.changed_fraction = changed_fraction
+
+        self.fingerprints = {}
+
+    def fingerprint(self, img):
+        """
+        Compute the downsampled grayscale fingerprint of a region
+
+        Args:
+            img: CapturedFrame or BGR numpy array
+
+        Returns:
+            int16 numpy array of fingerprint_size
+        """
+        gray = cv2.cvtColor(to_bgr(img), cv2.COLOR_BGR2GRAY)
+        small = cv2.resize(gray, self.fingerprint_size, interpolation=cv2.INTER_AREA)
+        return small.astype(np.int16)
+
+    def update(self, regions):
+        """
+        Compare regions against their previous fingerprints
+
+        Args:
+            regions: Dict of region name -> CapturedFrame or BGR array
+
+        Returns:
+            Dict of region name -> True if the region changed (dirty)
+        """
+        dirty = {}
+
+        for name, img in regions.items():
+            current = self.fingerprint(img)
+            previous = self.fingerprints.get(name)
+
+            if previous is None or previous.shape != current.shape:
+                changed = True
+            else:
+                moved = np.count_nonzero(np.abs(current - previous) > self.pixel_delta)
+                changed = bool(moved > self.changed_fraction * current.size)
+
+            # Only advance the baseline on change, so slow drift still
+            # accumulates until it crosses the threshold
+            if changed:
+                self.fingerprints[name] = current
+
+            dirty[name] = changed
+
+        return dirty
+
+    def invalidate(self, name=None):
+        """Force a region (or every region) to be reported dirty next time"""
+        if name is None:
+            self.fingerprints.clear()
+        else:
+            self.fingerprints.pop(name, None)
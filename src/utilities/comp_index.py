@@ -0,0 +1,75 @@
+class CompIndex:
+    """
+    Inverted index over meta compositions for fast board matching
+
+    Every champion gets one bit and every comp is stored as an int bitset
+    of its units, alongside a unit -> comps inverted index. Matching a
+    board only visits comps that share at least one unit with it, and the
+    match count and missing units come from a single AND / AND NOT plus a
+    popcount instead of building Python sets per comp. The popcount uses
+    bin().count() rather than int.bit_count(), which needs Python 3.10.
+    """
+
+    def __init__(self, comps, units_key='units'):
+        """
+        Args:
+            comps: List of comp dicts
+            units_key: Key holding each comp's list of unit names
+        """
+        self.comps = list(comps)
+        self.unit_bits = {}
+        self.comp_masks = []
+        self.unit_comps = {}
+
+        for index, comp in enumerate(self.comps):
+            mask = 0
+            for unit in comp.get(units_key) or []:
+                bit = self.unit_bits.setdefault(unit, len(self.unit_bits))
+                if not mask >> bit & 1:
+                    self.unit_comps.setdefault(unit, []).append(index)
+                mask |= 1 << bit
+            self.comp_masks.append(mask)
+
+        # Bit position -> unit name
+        self.units = list(self.unit_bits)
+
+    def __len__(self):
+        return len(self.comps)
+
+    def mask_of(self, units):
+        """Bitset of the given units (unknown units are ignored)"""
+        mask = 0
+        for unit in units:
+            bit = self.unit_bits.get(unit)
+            if bit is not None:
+                mask |= 1 << bit
+        return mask
+
+    def units_of(self, mask):
+        """Unit names of a bitset, in index order"""
+        units = []
+        while mask:
+            low = mask & -mask
+            units.append(self.units[low.bit_length() - 1])
+            mask ^= low
+        return units
+
+    def match(self, current_units):
+        """
+        Find every comp sharing at least one unit with the board
+
+        Args:
+            current_units: Unit names on the board
+
+        Returns:
+            List of (comp, match count, missing unit names) in comp order
+        """
+        board = self.mask_of(current_units)
+        candidates = sorted({index for unit in set(current_units) for index in self.unit_comps.get(unit, ())})
+
+        return [
+            (self.comps[index],
+             bin(self.comp_masks[index] & board).count("1"),
+             self.units_of(self.comp_masks[index] & ~board))
+            for index in candidates
+        ]
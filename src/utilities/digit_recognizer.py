@@ -0,0 +1,191 @@
+import argparse
+import os
+import re
+import cv2
+import numpy as np
+from PIL import Image
+if __package__:
+    from .screen_capture import to_bgr
+else:
+    from screen_capture import to_bgr
+
+class DigitRecognizer:
+    """
+    Glyph matcher for the fixed-font HUD numbers (gold, level, HP)
+
+    Digits are segmented with connected components, normalized to a fixed
+    size and scored against a small glyph bank with a single matrix
+    product, so a read takes well under a millisecond. The bank is built
+    from labelled captures with calibrate_from_captures().
+    """
+
+    # (width, height) every glyph is normalized to
+    GLYPH_SIZE = (12, 18)
+
+    def __init__(self, bank_path="glyph_bank.npz", min_confidence=0.8):
+        self.bank_path = bank_path
+
+        # Reads whose worst glyph scores below this are left to Tesseract
+        self.min_confidence = min_confidence
+
+        self.labels = []
+        self.bank = None  # (n_labels, glyph pixels) zero-mean, unit-norm rows
+        self.load_bank()
+
+    def load_bank(self):
+        """Load the glyph bank from disk if it has been calibrated"""
+        if not os.path.exists(self.bank_path):
+            return
+
+        data = np.load(self.bank_path)
+        self.labels = [str(label) for label in data["labels"]]
+        self.bank = data["bank"].astype(np.float32)
+
+    def save_bank(self):
+        """Save the glyph bank to disk"""
+        np.savez(self.bank_path, labels=np.array(self.labels), bank=self.bank)
+
+    def is_calibrated(self):
+        """Check if a glyph bank is available"""
+        return self.bank is not None and len(self.labels) > 0
+
+    def segment(self, img):
+        """
+        Split a HUD number box into normalized glyph vectors
+
+        Args:
+            img: PIL Image, CapturedFrame or numpy array of the number box
+
+        Returns:
+            (n_glyphs, glyph pixels) float32 array, left to right
+        """
+        gray = self._to_gray(img)
+        _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+
+        # Glyphs should be the foreground; flip if Otsu picked the background
+        if np.count_nonzero(binary) > binary.size / 2:
+            binary = cv2.bitwise_not(binary)
+
+        count, _, stats, _ = cv2.connectedComponentsWithStats(binary, connectivity=8)
+        if count <= 1:
+            return np.empty((0, self.GLYPH_SIZE[0] * self.GLYPH_SIZE[1]), dtype=np.float32)
+
+        # Skip label 0 (background) and specks much shorter than the digits
+        boxes = stats[1:]
+        max_height = boxes[:, cv2.CC_STAT_HEIGHT].max()
+        boxes = boxes[(boxes[:, cv2.CC_STAT_HEIGHT] >= 0.5 * max_height) &
+                      (boxes[:, cv2.CC_STAT_AREA] >= 4)]
+        boxes = boxes[np.argsort(boxes[:, cv2.CC_STAT_LEFT])]
+
+        glyphs = []
+        for x, y, w, h, _ in boxes:
+            glyph = cv2.resize(binary[y:y+h, x:x+w], self.GLYPH_SIZE, interpolation=cv2.INTER_AREA)
+            glyphs.append(self._normalize(glyph))
+
+        return np.stack(glyphs)
+
+    def read_number(self, img):
+        """
+        Recognize the number in a HUD box
+
+        Args:
+            img: PIL Image, CapturedFrame or numpy array of the number box
+
+        Returns:
+            (int value or None, confidence 0-1 of the weakest glyph)
+        """
+        if not self.is_calibrated():
+            return None, 0.0
+
+        glyphs = self.segment(img)
+        if len(glyphs) == 0:
+            return None, 0.0
+
+        scores = glyphs @ self.bank.T
+        best = scores.argmax(axis=1)
+        confidence = float(scores[np.arange(len(best)), best].min())
+
+        text = ''.join(self.labels[i] for i in best)
+        return int(text), confidence
+
+    def calibrate(self, samples):
+        """
+        Build the glyph bank from labelled samples
+
+        Args:
+            samples: List of (image, label) pairs, e.g. (gold box, "45")
+
+        Returns:
+            Number of samples used
+        """
+        vectors = {}
+        used = 0
+
+        for img, label in samples:
+            glyphs = self.segment(img)
+            if len(glyphs) != len(label):
+                print(f"Skipping sample '{label}': found {len(glyphs)} glyphs")
+                continue
+
+            for char, glyph in zip(label, glyphs):
+                vectors.setdefault(char, []).append(glyph)
+            used += 1
+
+        if not vectors:
+            return 0
+
+        self.labels = sorted(vectors)
+        self.bank = np.stack([self._normalize(np.mean(vectors[c], axis=0)) for c in self.labels])
+        return used
+
+    def calibrate_from_captures(self, captures_dir="captures"):
+        """
+        Build and save the glyph bank from saved HUD box captures
+
+        Files must be named <anything>_<value>.png, e.g. gold_45.png
+
+        Args:
+            captures_dir: Directory containing the labelled captures
+
+        Returns:
+            Number of samples used
+        """
+        samples = []
+        for filename in sorted(os.listdir(captures_dir)):
+            match = re.search(r'_(\d+)\.(png|jpg)$', filename)
+            if match:
+                img = Image.open(os.path.join(captures_dir, filename))
+                samples.append((img, match.group(1)))
+
+        used = self.calibrate(samples)
+        if used:
+            self.save_bank()
+
+        return used
+
+    def _to_gray(self, img):
+        """Convert any supported image type to a grayscale numpy array"""
+        if isinstance(img, Image.Image):
+            return np.array(img.convert('L'))
+        img = to_bgr(img)
+        if img.ndim == 3:
+            return cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+        return img
+
+    def _normalize(self, glyph):
+        """Flatten a glyph to a zero-mean, unit-norm float32 vector"""
+        vector = np.asarray(glyph, dtype=np.float32).ravel()
+        vector = vector - vector.mean()
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build the HUD digit glyph bank")
+    parser.add_argument("--captures", default="captures", help="Directory of labelled HUD captures")
+    parser.add_argument("--bank", default="glyph_bank.npz", help="Output glyph bank path")
+    args = parser.parse_args()
+
+    recognizer = DigitRecognizer(bank_path=args.bank)
+    used = recognizer.calibrate_from_captures(args.captures)
+    print(f"Calibrated glyph bank from {used} samples: {', '.join(recognizer.labels)}")
@@ -1,3 +1,4 @@
+import copy
 import json
 
 class GameState:
@@ -24,6 +25,20 @@ class GameState:
         self.health = data.get("health", 100)
         self.stage = data.get("stage", "")
     
+    def to_dict(self):
+        """Get an independent snapshot of the game state as a dictionary"""
+        return copy.deepcopy({
+            "round": self.round,
+            "level": self.level,
+            "gold": self.gold,
+            "current_board": self.current_board,
+            "bench": self.bench,
+            "available_shops": self.available_shops,
+            "synergies": self.synergies,
+            "health": self.health,
+            "stage": self.stage
+        })
+    
     def is_valid(self):
         """Check if game state has valid data"""
         return (
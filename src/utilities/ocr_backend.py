@@ -0,0 +1,305 @@
+import hashlib
+import os
+import queue
+import shlex
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+import numpy as np
+import pytesseract
+from PIL import Image
+
+try:
+    import tesserocr
+except ImportError:
+    tesserocr = None
+
+
+def parse_tesseract_config(config):
+    """
+    Split a pytesseract-style config string into page mode and variables
+
+    Args:
+        config: e.g. "--psm 7 -c tessedit_char_whitelist=0123456789"
+
+    Returns:
+        (psm or None, dict of tesseract variables)
+    """
+    psm = None
+    variables = {}
+
+    tokens = shlex.split(config or "")
+    i = 0
+    while i < len(tokens):
+        token = tokens[i]
+        if token == "--psm" and i + 1 < len(tokens):
+            psm = int(tokens[i + 1])
+            i += 1
+        elif token == "-c" and i + 1 < len(tokens):
+            key, _, value = tokens[i + 1].partition("=")
+            variables[key] = value
+            i += 1
+        i += 1
+
+    return psm, variables
+
+
+class OCRResultCache:
+    """
+    Bounded LRU cache of OCR results keyed by image content
+
+    Shop cards and HUD boxes often show identical pixels on consecutive
+    ticks; a blake2b digest of the preprocessed image bytes then returns
+    the earlier result instead of running Tesseract again.
+    """
+
+    def __init__(self, max_entries=512):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def make_key(self, img, config, kind):
+        """
+        Build the cache key for an image and OCR config
+
+        Args:
+            img: PIL Image or numpy array (already preprocessed)
+            config: pytesseract-style config string
+            kind: Which result is cached ("text" or "confidence")
+
+        Returns:
+            Hashable key
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        if isinstance(img, np.ndarray):
+            digest.update(f"{img.shape}{img.dtype}".encode())
+            digest.update(np.ascontiguousarray(img).tobytes())
+        else:
+            digest.update(f"{img.size}{img.mode}".encode())
+            digest.update(img.tobytes())
+
+        return digest.digest(), config, kind
+
+    def get(self, key):
+        """Get a cached result (None on miss) and update the counters"""
+        with self.lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return self.entries[key]
+
+            self.misses += 1
+            return None
+
+    def put(self, key, value):
+        """Store a result, evicting the least recently used entry if full"""
+        with self.lock:
+            self.entries[key] = value
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def clear(self):
+        """Drop all entries and reset the counters"""
+        with self.lock:
+            self.entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def get_stats(self):
+        """Get hit/miss counters"""
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self.entries),
+                "hit_rate": self.hits / lookups * 100 if lookups else 0.0
+            }
+
+
+class PytesseractEngine:
+    """Fallback engine: one tesseract process per call via pytesseract"""
+
+    name = "pytesseract"
+
+    def image_to_string(self, img, config=""):
+        return pytesseract.image_to_string(img, config=config)
+
+    def image_to_text_and_confidence(self, img, config=""):
+        data = pytesseract.image_to_data(img, config=config, output_type=pytesseract.Output.DICT)
+
+        words = []
+        confidences = []
+        for word, conf in zip(data["text"], data["conf"]):
+            if word.strip() and float(conf) >= 0:
+                words.append(word.strip())
+                confidences.append(float(conf))
+
+        confidence = sum(confidences) / len(confidences) if confidences else 0.0
+        return " ".join(words), confidence
+
+
+class TesserocrEngine:
+    """
+    Pool of long-lived tesseract API handles (tesserocr)
+
+    Each handle keeps its language model loaded and takes images from
+    memory, so no process is spawned and no temp file is written per call.
+    Handles are not thread-safe, so each call checks one out of the pool.
+    """
+
+    name = "tesserocr"
+
+    def __init__(self, workers=4, lang="eng"):
+        self.apis = queue.Queue()
+
+        kwargs = {"lang": lang}
+        tessdata = os.getenv("TESSDATA_PREFIX")
+        if tessdata:
+            kwargs["path"] = tessdata
+
+        for _ in range(workers):
+            self.apis.put(tesserocr.PyTessBaseAPI(**kwargs))
+
+    @contextmanager
+    def _acquire(self):
+        api = self.apis.get()
+        try:
+            yield api
+        finally:
+            self.apis.put(api)
+
+    def image_to_string(self, img, config=""):
+        return self.image_to_text_and_confidence(img, config)[0]
+
+    def image_to_text_and_confidence(self, img, config=""):
+        psm, variables = parse_tesseract_config(config)
+
+        if isinstance(img, np.ndarray):
+            img = Image.fromarray(img)
+
+        with self._acquire() as api:
+            previous = {key: api.GetVariableAsString(key) for key in variables}
+            try:
+                api.SetPageSegMode(psm if psm is not None else tesserocr.PSM.AUTO)
+                for key, value in variables.items():
+                    api.SetVariable(key, value)
+
+                api.SetImage(img)
+                return api.GetUTF8Text(), float(api.MeanTextConf())
+            finally:
+                # Handles are shared, so undo per-call settings
+                for key, value in previous.items():
+                    api.SetVariable(key, value or "")
+                api.Clear()
+
+
+class OCRBackend:
+    """
+    OCR entry point shared by OCRReader, ChampionRecognizer and
+    BoardDetectorEnhanced
+
+    Uses a persistent tesserocr pool when tesserocr is installed and falls
+    back to pytesseract otherwise. map() runs several images concurrently
+    on a small thread pool in both modes. Results are cached by image
+    content, so unchanged shop cards and HUD boxes skip OCR entirely.
+    """
+
+    def __init__(self, workers=4, cache_size=512):
+        self.workers = workers
+        self.engine = None
+        self.cache = OCRResultCache(cache_size)
+
+        if tesserocr is not None:
+            try:
+                self.engine = TesserocrEngine(workers)
+            except Exception as e:
+                print(f"tesserocr unavailable, falling back to pytesseract: {e}")
+
+        if self.engine is None:
+            self.engine = PytesseractEngine()
+
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ocr")
+
+    def image_to_string(self, img, config=""):
+        """
+        Extract text from an image
+
+        Args:
+            img: PIL Image or numpy array
+            config: pytesseract-style config string
+
+        Returns:
+            Extracted text as string
+        """
+        key = self.cache.make_key(img, config, "text")
+        text = self.cache.get(key)
+        if text is None:
+            text = self.engine.image_to_string(img, config)
+            self.cache.put(key, text)
+        return text
+
+    def image_to_text_and_confidence(self, img, config=""):
+        """
+        Extract text and mean word confidence from an image
+
+        Args:
+            img: PIL Image or numpy array
+            config: pytesseract-style config string
+
+        Returns:
+            (text, confidence 0-100)
+        """
+        key = self.cache.make_key(img, config, "confidence")
+        result = self.cache.get(key)
+        if result is None:
+            result = self.engine.image_to_text_and_confidence(img, config)
+            self.cache.put(key, result)
+        return result
+
+    def map(self, images, config=""):
+        """
+        Extract text from several images concurrently
+
+        Args:
+            images: List of PIL Images or numpy arrays
+            config: pytesseract-style config string applied to every image
+
+        Returns:
+            List of strings in input order
+        """
+        return list(self.executor.map(lambda img: self.image_to_string(img, config), images))
+
+    def map_with_confidence(self, images, configs):
+        """
+        Extract text and mean word confidence from several images concurrently
+
+        Args:
+            images: List of PIL Images or numpy arrays
+            configs: List of config strings, one per image
+
+        Returns:
+            List of (text, confidence 0-100) tuples in input order
+        """
+        return list(self.executor.map(self.image_to_text_and_confidence, images, configs))
+
+    def get_cache_stats(self):
+        """Get OCR result cache hit/miss counters"""
+        return self.cache.get_stats()
+
+
+_backend = None
+_backend_lock = threading.Lock()
+
+
+def get_ocr_backend():
+    """Get the process-wide OCR backend, creating it on first use"""
+    global _backend
+    with _backend_lock:
+        if _backend is None:
+            _backend = OCRBackend()
+        return _backend
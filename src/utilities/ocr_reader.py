@@ -1,11 +1,37 @@
 import pytesseract
 import re
-from PIL import Image, ImageEnhance, ImageFilter
+from PIL import Image, ImageEnhance, ImageFilter, ImageOps
 from dotenv import load_dotenv
 import os
+if __package__:
+    from .ocr_backend import get_ocr_backend
+    from .digit_recognizer import DigitRecognizer
+else:
+    from ocr_backend import get_ocr_backend
+    from digit_recognizer import DigitRecognizer
 
 load_dotenv()
 
+# Single-line, digits-only Tesseract configs for the HUD number boxes
+DIGITS_CONFIG = '--psm 7 -c tessedit_char_whitelist=0123456789'
+HUD_FIELD_CONFIGS = {
+    "level": DIGITS_CONFIG,
+    "gold": DIGITS_CONFIG,
+    "health": DIGITS_CONFIG,
+    "stage": '--psm 7 -c tessedit_char_whitelist=0123456789-'
+}
+
+# Plausible values per numeric HUD box; a digits-only whitelist turns any
+# pixels into digits, so readings outside these ranges are rejected
+HUD_FIELD_RANGES = {
+    "level": (1, 10),
+    "gold": (0, 999),
+    "health": (0, 100)
+}
+
+# Stage box reads like "3-2": stage 1-9, round 1-7
+STAGE_PATTERN = re.compile(r'^([1-9])-([1-7])$')
+
 class OCRReader:
     def __init__(self):
         # Set Tesseract path if specified in environment
@@ -13,16 +39,46 @@ class OCRReader:
         if tesseract_path:
             pytesseract.pytesseract.tesseract_cmd = tesseract_path
 
+        self.backend = get_ocr_backend()
+
+        # Glyph matcher for the numeric HUD boxes (Tesseract is the fallback)
+        self.digit_recognizer = DigitRecognizer()
+
+        # Last results per method, reused when the caller reports no change
+        self.last_results = {}
+
+        # Tesseract readings of HUD boxes below this confidence are dropped
+        self.min_hud_confidence = 60.0
+
+        # HUD number boxes (x, y, w, h) per resolution (adjust per setup)
+        self.hud_calibration = {
+            "1920x1080": {
+                "stage": (770, 5, 90, 28),
+                "level": (300, 882, 50, 24),
+                "gold": (868, 882, 56, 24),
+                "health": (1790, 190, 50, 26)
+            },
+            "2560x1440": {
+                "stage": (1027, 7, 120, 37),
+                "level": (400, 1176, 67, 32),
+                "gold": (1157, 1176, 75, 32),
+                "health": (2387, 253, 67, 35)
+            }
+        }
+
     def preprocess_image(self, img):
         """
         Preprocess image for better OCR results
 
         Args:
-            img: PIL Image object
+            img: PIL Image object or CapturedFrame
 
         Returns:
             Preprocessed PIL Image
         """
+        if hasattr(img, 'to_pil'):
+            img = img.to_pil()
+
         # Convert to grayscale
         img = img.convert('L')
 
@@ -50,23 +106,42 @@ class OCRReader:
             img = self.preprocess_image(img)
 
         try:
-            text = pytesseract.image_to_string(img)
+            text = self.backend.image_to_string(img)
             return text.strip()
         except Exception as e:
             print(f"OCR Error: {e}")
             return ""
 
-    def read_game_stats(self, img):
+    def read_game_stats(self, img, changed=True):
         """
         Extract game statistics from screenshot
         This is a TFT-specific method
 
+        Reads the calibrated HUD boxes first and only falls back to
+        free-text OCR of the whole image if the level box is unreadable.
+
         Args:
             img: PIL Image object of game screen
+            changed: False if the region is unchanged since the last call,
+                in which case the previous stats are returned without OCR
 
         Returns:
             Dictionary with extracted game stats
         """
+        if not changed and 'game_stats' in self.last_results:
+            return dict(self.last_results['game_stats'])
+
+        hud = self.read_hud(img)
+        if hud["level"]["value"]:
+            game_stats = {
+                "level": hud["level"]["value"],
+                "gold": hud["gold"]["value"] or 0,
+                "health": hud["health"]["value"] if hud["health"]["value"] is not None else 100,
+                "stage": hud["stage"]["value"] or ""
+            }
+            self.last_results['game_stats'] = dict(game_stats)
+            return game_stats
+
         text = self.read_text(img)
 
         game_stats = {
@@ -76,8 +151,147 @@ class OCRReader:
             "stage": self._extract_stage(text)
         }
 
+        self.last_results['game_stats'] = dict(game_stats)
         return game_stats
 
+    def get_hud_regions(self, resolution=(1920, 1080)):
+        """
+        Get the HUD number boxes for a resolution
+
+        Args:
+            resolution: (width, height) screen resolution
+
+        Returns:
+            Dict of field name -> (x, y, w, h), scaled from 1080p if the
+            resolution has no calibration of its own
+        """
+        width, height = resolution
+        regions = self.hud_calibration.get(f"{width}x{height}")
+        if regions:
+            return dict(regions)
+
+        sx, sy = width / 1920, height / 1080
+        return {
+            field: (int(x * sx), int(y * sy), int(w * sx), int(h * sy))
+            for field, (x, y, w, h) in self.hud_calibration["1920x1080"].items()
+        }
+
+    def read_hud(self, img):
+        """
+        Read all HUD fields from a full screenshot
+
+        Args:
+            img: PIL Image object or CapturedFrame of the game screen
+
+        Returns:
+            Same as read_hud_fields()
+        """
+        if hasattr(img, 'to_pil'):
+            img = img.to_pil()
+
+        fields = {}
+        for field, (x, y, w, h) in self.get_hud_regions(img.size).items():
+            fields[field] = img.crop((x, y, x + w, y + h))
+
+        return self.read_hud_fields(fields)
+
+    def read_hud_fields(self, fields, changed=None):
+        """
+        Read pre-cropped HUD boxes into typed values
+
+        Numeric boxes go through the glyph matcher first; boxes it is not
+        confident about (and the stage box) get a single-line digits-only
+        Tesseract pass, run in parallel on the OCR backend.
+
+        Args:
+            fields: Dict of field name ("level", "gold", "health", "stage")
+                -> PIL Image or CapturedFrame of that box
+            changed: Optional dict of field name -> changed flag; unchanged
+                fields reuse their previous reading
+
+        Returns:
+            Dict of field name -> {"value": int/str or None, "confidence": 0-100};
+            low-confidence and out-of-range readings have value None and
+            are not reused for unchanged boxes
+        """
+        previous = self.last_results.setdefault('hud', {})
+        results = {}
+
+        to_read = []
+        for field in fields:
+            if changed is not None and not changed.get(field, True) and field in previous:
+                results[field] = dict(previous[field])
+                continue
+
+            if field != "stage":
+                value, confidence = self.digit_recognizer.read_number(fields[field])
+                if confidence >= self.digit_recognizer.min_confidence and self._is_valid_hud_value(field, value):
+                    results[field] = {"value": value, "confidence": confidence * 100}
+                    previous[field] = dict(results[field])
+                    continue
+
+            to_read.append(field)
+
+        if to_read:
+            images = [self._preprocess_hud_field(fields[field]) for field in to_read]
+            configs = [HUD_FIELD_CONFIGS.get(field, DIGITS_CONFIG) for field in to_read]
+
+            try:
+                readings = self.backend.map_with_confidence(images, configs)
+            except Exception as e:
+                print(f"OCR Error: {e}")
+                readings = [("", 0.0)] * len(to_read)
+
+            for field, (text, confidence) in zip(to_read, readings):
+                value = self._parse_hud_value(field, text)
+                if confidence < self.min_hud_confidence or not self._is_valid_hud_value(field, value):
+                    # Failed read: report nothing and read the box again next time
+                    results[field] = {"value": None, "confidence": confidence}
+                    previous.pop(field, None)
+                    continue
+
+                results[field] = {"value": value, "confidence": confidence}
+                previous[field] = dict(results[field])
+
+        for field in HUD_FIELD_CONFIGS:
+            results.setdefault(field, {"value": None, "confidence": 0.0})
+
+        return results
+
+    def _preprocess_hud_field(self, img):
+        """Upscale and binarize a HUD box to dark digits on a light background"""
+        if hasattr(img, 'to_pil'):
+            img = img.to_pil()
+
+        img = img.convert('L')
+        img = img.resize((img.width * 3, img.height * 3), Image.LANCZOS)
+        img = ImageOps.autocontrast(img)
+
+        # HUD digits are light on dark; Tesseract prefers the opposite
+        return ImageOps.invert(img).point(lambda p: 255 if p > 128 else 0)
+
+    def _parse_hud_value(self, field, text):
+        """Convert OCR text of a HUD box into a typed value"""
+        text = text.strip()
+
+        if field == "stage":
+            match = re.search(r'(\d+)-(\d+)', text)
+            return match.group(0) if match else None
+
+        digits = ''.join(c for c in text if c.isdigit())
+        return int(digits) if digits else None
+
+    def _is_valid_hud_value(self, field, value):
+        """Check a parsed HUD value against what the game can show"""
+        if value is None:
+            return False
+
+        if field == "stage":
+            return bool(STAGE_PATTERN.match(value))
+
+        low, high = HUD_FIELD_RANGES.get(field, (0, float("inf")))
+        return low <= value <= high
+
     def _extract_level(self, text):
         """Extract player level from text"""
         # Look for patterns like "Level 5" or "Lvl 5" or just number near "level"
@@ -167,17 +381,25 @@ class OCRReader:
 
         return detected_units
 
-    def detect_shop_units(self, img, shop_region=None):
+    def detect_shop_units(self, img, shop_region=None, changed=True):
         """
         Detect units available in the shop
 
         Args:
-            img: PIL Image object
+            img: PIL Image object or CapturedFrame
             shop_region: Tuple (left, top, width, height) of shop area
+            changed: False if the shop is unchanged since the last call,
+                in which case the previous units are returned without OCR
 
         Returns:
             List of unit names in shop
         """
+        if not changed and 'shop_units' in self.last_results:
+            return list(self.last_results['shop_units'])
+
+        if hasattr(img, 'to_pil'):
+            img = img.to_pil()
+
         if shop_region:
             img = img.crop((
                 shop_region[0],
@@ -186,4 +408,6 @@ class OCRReader:
                 shop_region[1] + shop_region[3]
             ))
 
-        return self.read_unit_names(img)
+        units = self.read_unit_names(img)
+        self.last_results['shop_units'] = list(units)
+        return units
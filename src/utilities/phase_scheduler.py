@@ -0,0 +1,171 @@
+import re
+import threading
+import time
+
+class PhaseScheduler:
+    """
+    Adaptive polling for the auto-updater, driven by the game phase
+
+    The phase (planning, combat, carousel, loading) is inferred from the
+    stage string plus cheap pixel probes of the captured regions; while no
+    stage has been read the phase is "unknown" and everything is polled
+    at planning rates, since only a dark HUD means loading. Each
+    phase has its own poll interval per region group, e.g. the shop is
+    polled 4x a second while planning but only probed during combat.
+    Every decision is recorded so the rates can be tuned.
+    """
+
+    PHASES = ("planning", "combat", "carousel", "loading", "unknown")
+
+    # Seconds between polls per phase and region group (None = paused)
+    DEFAULT_INTERVALS = {
+        "planning": {"shop": 0.25, "hud": 1.0},
+        "combat": {"shop": 2.0, "hud": 1.0},
+        "carousel": {"shop": None, "hud": 2.0},
+        "loading": {"shop": None, "hud": 5.0},
+        "unknown": {"shop": 0.25, "hud": 1.0},
+    }
+
+    def __init__(self, planning_duration=30.0, dark_threshold=20.0, shop_open_threshold=45.0):
+        self.intervals = {phase: dict(groups) for phase, groups in self.DEFAULT_INTERVALS.items()}
+
+        # Seconds of planning after a new stage shows up
+        self.planning_duration = planning_duration
+
+        # Mean brightness below which the HUD counts as not drawn (loading)
+        self.dark_threshold = dark_threshold
+
+        # Mean shop brightness above which the shop panel counts as open
+        self.shop_open_threshold = shop_open_threshold
+
+        self.phase = "unknown"
+        self.reason = "no game state yet"
+        self.phase_since = time.time()
+
+        self.current_stage = ""
+        self.stage_started_at = None
+        self.probes = {}
+        self.last_polled = {}
+        self.history = []
+
+        self.lock = threading.Lock()
+
+    def observe(self, stage, probes=None, now=None):
+        """
+        Update the phase from the latest stage string and pixel probes
+
+        Args:
+            stage: Stage string from the HUD, e.g. "3-2" ("" if unknown)
+            probes: Optional dict with "hud_brightness" and/or
+                "shop_brightness" (mean pixel value of those regions);
+                the latest value of each probe is kept between calls
+            now: Timestamp (defaults to time.time())
+
+        Returns:
+            The current phase name
+        """
+        now = time.time() if now is None else now
+
+        with self.lock:
+            self.probes.update(probes or {})
+
+            if stage and stage != self.current_stage:
+                self.current_stage = stage
+                self.stage_started_at = now
+
+            phase, reason = self._infer_phase(self.probes, now)
+            if phase != self.phase:
+                self.history.append({"at": now, "from": self.phase, "to": phase, "reason": reason})
+                del self.history[:-20]
+                self.phase = phase
+                self.phase_since = now
+            self.reason = reason
+
+            return self.phase
+
+    def _infer_phase(self, probes, now):
+        """Decide the phase; returns (phase, human-readable reason)"""
+        hud_brightness = probes.get("hud_brightness")
+        if hud_brightness is not None and hud_brightness < self.dark_threshold:
+            return "loading", f"HUD dark (brightness {hud_brightness:.0f})"
+
+        match = re.match(r'(\d+)-(\d+)', self.current_stage or "")
+        if not match:
+            return "unknown", "no stage detected"
+
+        stage, round_num = int(match.group(1)), int(match.group(2))
+        if (stage == 1 and round_num == 1) or (stage >= 2 and round_num == 4):
+            return "carousel", f"stage {self.current_stage} is a carousel round"
+
+        elapsed = now - self.stage_started_at
+        if elapsed < self.planning_duration:
+            return "planning", f"{elapsed:.0f}s into stage {self.current_stage}"
+
+        shop_brightness = probes.get("shop_brightness")
+        if shop_brightness is not None and shop_brightness > self.shop_open_threshold:
+            return "planning", f"shop open (brightness {shop_brightness:.0f})"
+
+        return "combat", f"{elapsed:.0f}s into stage {self.current_stage}, shop closed"
+
+    def due_groups(self, now=None):
+        """
+        Get the region groups that should be polled now
+
+        Returns:
+            Set of group names ("hud", "shop")
+        """
+        now = time.time() if now is None else now
+
+        with self.lock:
+            due = set()
+            for group, interval in self.intervals[self.phase].items():
+                if interval is None:
+                    continue
+                if now - self.last_polled.get(group, 0.0) >= interval:
+                    due.add(group)
+            return due
+
+    def mark_polled(self, groups, now=None):
+        """Record that the given groups were just captured"""
+        now = time.time() if now is None else now
+
+        with self.lock:
+            for group in groups:
+                self.last_polled[group] = now
+
+    def next_due_in(self, now=None):
+        """Seconds until the next group is due in the current phase"""
+        now = time.time() if now is None else now
+
+        with self.lock:
+            waits = [
+                self.last_polled.get(group, 0.0) + interval - now
+                for group, interval in self.intervals[self.phase].items()
+                if interval is not None
+            ]
+            return max(0.0, min(waits)) if waits else 1.0
+
+    def set_interval(self, phase, group, seconds):
+        """Tune one phase/group poll interval (None pauses the group)"""
+        with self.lock:
+            self.intervals[phase][group] = seconds
+
+    def get_decisions(self):
+        """
+        Get the scheduler's current reasoning for tuning
+
+        Returns:
+            dict with phase, reason, phase age, active intervals, last poll
+            times and the recent phase transitions
+        """
+        with self.lock:
+            return {
+                "phase": self.phase,
+                "reason": self.reason,
+                "phase_age": time.time() - self.phase_since,
+                "stage": self.current_stage,
+                "probes": dict(self.probes),
+                "intervals": dict(self.intervals[self.phase]),
+                "last_polled": dict(self.last_polled),
+                "history": list(self.history)
+            }
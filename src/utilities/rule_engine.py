@@ -0,0 +1,182 @@
+import json
+import operator
+import os
+import threading
+
+class RuleEngine:
+    """
+    Compiled evaluator for the config.json recommendation rules
+
+    Each rule's condition is compiled once into a closure and indexed by
+    the GameState field it reads (synergy.* rules depend on "synergies",
+    shop_has rules on "available_shops"). Results are cached per rule, so
+    an evaluation only re-runs the rules whose fields changed since the
+    last call. The rules are recompiled when the config file changes.
+    """
+
+    # GameState fields rules can depend on
+    FIELDS = ("level", "gold", "health", "stage", "synergies", "available_shops")
+
+    OPERATORS = {
+        "gt": operator.gt,
+        "gte": operator.ge,
+        "lt": operator.lt,
+        "lte": operator.le,
+        "eq": operator.eq,
+        "contains": lambda actual, value: value in actual
+    }
+
+    def __init__(self, config_path='config.json'):
+        self.config_path = config_path
+        self.config = {}
+        self.config_mtime = None
+        self.load_error = None
+
+        self.recommendations = []
+        self.checks = []
+        self.rules_by_field = {}
+
+        self.results = None
+        self.last_snapshot = None
+        self.last_recomputed = []
+
+        self.lock = threading.Lock()
+        self.reload_if_changed()
+
+    def reload_if_changed(self):
+        """
+        Recompile the rules if the config file changed on disk
+
+        A missing, half-written or invalid config keeps the last good rules
+        in place and is retried on the next call.
+
+        Returns:
+            True if the rules were (re)compiled
+        """
+        try:
+            mtime = os.path.getmtime(self.config_path)
+            if mtime == self.config_mtime:
+                return False
+
+            with open(self.config_path, 'r') as f:
+                config = json.load(f)
+
+            compiled = self._compile_rules(config.get("rules", []))
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            # Report each problem once rather than on every evaluation
+            if str(e) != self.load_error:
+                self.load_error = str(e)
+                print(f"Failed to load rules from {self.config_path}: {e}")
+            return False
+
+        self.load_error = None
+        with self.lock:
+            self.recommendations, self.checks, self.rules_by_field = compiled
+            self.config = config
+            self.config_mtime = mtime
+
+            # Force a full evaluation on the next call
+            self.results = None
+            self.last_snapshot = None
+        return True
+
+    def compile(self, rules):
+        """Compile rule conditions into closures indexed by field"""
+        self.recommendations, self.checks, self.rules_by_field = self._compile_rules(rules)
+
+        # Force a full evaluation on the next call
+        self.results = None
+        self.last_snapshot = None
+
+    def _compile_rules(self, rules):
+        """
+        Compile a rule list without touching the active rules
+
+        Returns:
+            (recommendations, checks, rules_by_field)
+        """
+        recommendations = []
+        checks = []
+        rules_by_field = {}
+
+        for index, rule in enumerate(rules):
+            check, field = self._compile_condition(rule["condition"])
+            recommendations.append(rule["recommendation"])
+            checks.append(check)
+            if field:
+                rules_by_field.setdefault(field, []).append(index)
+
+        return recommendations, checks, rules_by_field
+
+    def _compile_condition(self, condition):
+        """
+        Build a closure for one condition
+
+        Returns:
+            (check(game_state) -> bool, GameState field it depends on or None)
+        """
+        field = condition["field"]
+        value = condition["value"]
+
+        if field == "shop_has":
+            # Special case: check if shop contains a unit
+            return (lambda state: value in state.available_shops), "available_shops"
+
+        if field in ("level", "gold", "health", "stage"):
+            get_actual = operator.attrgetter(field)
+            depends_on = field
+        elif field.startswith("synergy."):
+            synergy_name = field.split(".")[1]
+            get_actual = lambda state: state.synergies.get(synergy_name, 0)
+            depends_on = "synergies"
+        else:
+            return (lambda state: False), None
+
+        compare = self.OPERATORS.get(condition["operator"])
+        if compare is None:
+            return (lambda state: False), depends_on
+
+        return (lambda state: compare(get_actual(state), value)), depends_on
+
+    def evaluate(self, game_state):
+        """
+        Get the recommendations of all rules that match the game state
+
+        Only rules whose fields changed since the previous call are
+        re-evaluated; the rest reuse their cached result.
+
+        Returns:
+            List of recommendation strings in config order
+        """
+        self.reload_if_changed()
+
+        with self.lock:
+            snapshot = self._snapshot(game_state)
+
+            if self.results is None:
+                dirty = range(len(self.checks))
+                results = [False] * len(self.checks)
+            else:
+                changed = [field for field in self.FIELDS if snapshot[field] != self.last_snapshot[field]]
+                dirty = sorted({i for field in changed for i in self.rules_by_field.get(field, [])})
+                results = list(self.results)
+
+            for i in dirty:
+                results[i] = self.checks[i](game_state)
+
+            self.results = results
+            self.last_snapshot = snapshot
+            self.last_recomputed = list(dirty)
+
+            return [rec for rec, matched in zip(self.recommendations, results) if matched]
+
+    def _snapshot(self, game_state):
+        """Copy the rule-relevant fields so later mutations can be diffed"""
+        return {
+            "level": game_state.level,
+            "gold": game_state.gold,
+            "health": game_state.health,
+            "stage": game_state.stage,
+            "synergies": dict(game_state.synergies),
+            "available_shops": list(game_state.available_shops)
+        }
@@ -1,11 +1,110 @@
 import mss
 import mss.tools
+import numpy as np
 from PIL import Image
 import os
 import sys
 import subprocess
 from datetime import datetime
 
+class CapturedFrame:
+    """
+    Screen frame backed by the raw mss buffer
+
+    `bgra` is a zero-copy numpy view over the pixels mss grabbed. The BGR
+    array handed to OpenCV and the PIL image used for OCR/saving are only
+    materialized on first access and then reused.
+    """
+
+    def __init__(self, bgra, left=0, top=0):
+        self.bgra = bgra
+        self.left = left
+        self.top = top
+        self._bgr = None
+        self._pil = None
+
+    @classmethod
+    def from_screenshot(cls, screenshot):
+        """Wrap an mss ScreenShot without copying its pixels"""
+        bgra = np.frombuffer(screenshot.raw, dtype=np.uint8)
+        bgra = bgra.reshape(screenshot.height, screenshot.width, 4)
+        return cls(bgra, screenshot.left, screenshot.top)
+
+    @classmethod
+    def from_pil(cls, img, left=0, top=0):
+        """Build a frame from a PIL image (WSL capture path)"""
+        rgba = np.asarray(img.convert("RGBA"))
+        return cls(np.ascontiguousarray(rgba[:, :, [2, 1, 0, 3]]), left, top)
+
+    @property
+    def width(self):
+        return self.bgra.shape[1]
+
+    @property
+    def height(self):
+        return self.bgra.shape[0]
+
+    @property
+    def size(self):
+        """(width, height), matching PIL's Image.size"""
+        return self.width, self.height
+
+    @property
+    def shape(self):
+        """Shape of the BGR view, matching an OpenCV image"""
+        return self.height, self.width, 3
+
+    @property
+    def bgr(self):
+        """Contiguous BGR array for OpenCV (computed once per frame)"""
+        if self._bgr is None:
+            self._bgr = np.ascontiguousarray(self.bgra[:, :, :3])
+        return self._bgr
+
+    def __array__(self, dtype=None, copy=None):
+        if dtype is None:
+            return self.bgr
+        return self.bgr.astype(dtype)
+
+    def to_pil(self):
+        """PIL RGB image, materialized lazily for OCR or saving"""
+        if self._pil is None:
+            bgra = np.ascontiguousarray(self.bgra)
+            self._pil = Image.frombuffer("RGB", self.size, bgra, "raw", "BGRX", 0, 1)
+        return self._pil
+
+    def crop(self, region):
+        """
+        Get a sub-frame sharing this frame's buffer
+
+        Args:
+            region: (x, y, w, h) tuple or dict with left/top/width/height
+
+        Returns:
+            CapturedFrame view over the region
+        """
+        if isinstance(region, dict):
+            x, y, w, h = region["left"], region["top"], region["width"], region["height"]
+        else:
+            x, y, w, h = region
+
+        return CapturedFrame(self.bgra[y:y+h, x:x+w], self.left + x, self.top + y)
+
+
+def to_bgr(img):
+    """
+    Get an OpenCV BGR array for a PIL image, CapturedFrame or BGR array
+
+    CapturedFrames return their cached BGR view without conversion; numpy
+    arrays are assumed to be BGR already and returned unchanged.
+    """
+    if isinstance(img, CapturedFrame):
+        return img.bgr
+    if isinstance(img, Image.Image):
+        return np.ascontiguousarray(np.asarray(img.convert("RGB"))[:, :, ::-1])
+    return img
+
+
 class ScreenCapture:
     def __init__(self):
         self.is_wsl = 'microsoft' in os.uname().release.lower()
@@ -31,6 +130,27 @@ class ScreenCapture:
         img = Image.frombytes("RGB", screenshot.size, screenshot.bgra, "raw", "BGRX")
         return img
 
+    def capture_frame(self, region=None):
+        """
+        Capture the screen (or a region) as a zero-copy CapturedFrame
+
+        Args:
+            region: Optional (x, y, w, h) tuple or left/top/width/height dict
+
+        Returns:
+            CapturedFrame backed by the mss buffer
+        """
+        if self.is_wsl:
+            frame = CapturedFrame.from_pil(self._capture_wsl())
+            return frame.crop(region) if region else frame
+
+        if region:
+            monitor = self._region_to_monitor(region)
+        else:
+            monitor = self.sct.monitors[1]  # Primary monitor
+
+        return CapturedFrame.from_screenshot(self.sct.grab(monitor))
+
     def _capture_wsl(self):
         """Capture screen from WSL using PowerShell"""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -94,6 +214,64 @@ $bitmap.Dispose()
         img = Image.frombytes("RGB", screenshot.size, screenshot.bgra, "raw", "BGRX")
         return img
 
+    def capture_regions(self, regions):
+        """
+        Capture several screen rectangles as CapturedFrames
+
+        Only the requested rectangles are grabbed, so the full-frame
+        grab and BGRA->RGB conversion is skipped entirely. Accepts the
+        region map from BoardDetectorEnhanced.calibration ((x, y, w, h)
+        tuples) or BoardDetector.get_board_region_coords() (dicts with
+        left/top/width/height).
+
+        Args:
+            regions: Dict of region name -> rectangle
+
+        Returns:
+            Dict of region name -> CapturedFrame (use .bgr for OpenCV)
+        """
+        if self.is_wsl:
+            # No mss under WSL: grab once and slice the regions out
+            frame = CapturedFrame.from_pil(self._capture_wsl())
+            return {name: frame.crop(region) for name, region in regions.items()}
+
+        return {
+            name: CapturedFrame.from_screenshot(self.sct.grab(self._region_to_monitor(region)))
+            for name, region in regions.items()
+        }
+
+    def _region_to_monitor(self, region, offset=True):
+        """
+        Convert a region rectangle into an mss monitor dict
+
+        Args:
+            region: (x, y, w, h) tuple or dict with left/top/width/height
+            offset: Shift by the primary monitor origin (multi-monitor setups)
+
+        Returns:
+            Dict with left, top, width, height
+        """
+        if isinstance(region, dict):
+            left, top = region["left"], region["top"]
+            width, height = region["width"], region["height"]
+        else:
+            left, top, width, height = region
+
+        if offset:
+            primary = self.sct.monitors[1]
+            left += primary["left"]
+            top += primary["top"]
+
+        return {"left": left, "top": top, "width": width, "height": height}
+
+    def get_screen_resolution(self):
+        """Get (width, height) of the primary monitor"""
+        if self.is_wsl:
+            return self._capture_wsl().size
+
+        primary = self.sct.monitors[1]
+        return primary["width"], primary["height"]
+
     def capture_game_region(self):
         """
         Capture the game region (TFT-specific)
@@ -112,12 +290,15 @@ $bitmap.Dispose()
         Save captured image to disk
 
         Args:
-            img: PIL Image object
+            img: PIL Image object or CapturedFrame
             filename: Optional custom filename
 
         Returns:
             Path to saved file
         """
+        if isinstance(img, CapturedFrame):
+            img = img.to_pil()
+
         if filename is None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"capture_{timestamp}.png"
@@ -0,0 +1,210 @@
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+class UIUpdateBus:
+    """
+    Hands state snapshots from worker threads to the Tk main loop
+
+    Workers call publish() from any thread; it only stores the snapshot in
+    a single latest-wins slot. The Tk main loop drains that slot through
+    root.after at a capped frame rate and renders the newest snapshot, so
+    widgets are only ever touched on the main thread and bursts of updates
+    collapse into one redraw. A snapshot equal to the last rendered one is
+    skipped, so code that draws into the same widgets directly must call
+    invalidate() afterwards.
+    """
+
+    def __init__(self, root, render, max_fps=10):
+        """
+        Args:
+            root: Tk root window that owns the main loop
+            render: Called on the main thread with each snapshot to draw
+            max_fps: Maximum number of renders per second
+        """
+        self.root = root
+        self.render = render
+        self.interval_ms = max(1, int(1000 / max_fps))
+
+        self.lock = threading.Lock()
+        self.pending = None
+        self.last_rendered = None
+
+        self.running = False
+        self.after_id = None
+
+        self.stats = {"published": 0, "coalesced": 0, "rendered": 0, "skipped": 0}
+
+    def publish(self, snapshot):
+        """Offer a new snapshot (safe to call from any thread)"""
+        with self.lock:
+            if self.pending is not None:
+                self.stats["coalesced"] += 1
+            self.pending = snapshot
+            self.stats["published"] += 1
+
+    def start(self):
+        """Start draining on the Tk main loop (call from the main thread)"""
+        if self.running:
+            return
+        self.running = True
+        self.after_id = self.root.after(self.interval_ms, self._drain)
+
+    def stop(self):
+        """Stop draining; pending snapshots are kept for the next start()"""
+        self.running = False
+        if self.after_id is not None:
+            self.root.after_cancel(self.after_id)
+            self.after_id = None
+
+    def invalidate(self):
+        """Forget the last rendered snapshot (call after drawing outside the bus)"""
+        with self.lock:
+            self.last_rendered = None
+
+    def _drain(self):
+        """Render the newest pending snapshot, then reschedule"""
+        with self.lock:
+            snapshot, self.pending = self.pending, None
+            last_rendered = self.last_rendered
+
+        if snapshot is not None:
+            if snapshot == last_rendered:
+                self.stats["skipped"] += 1
+            else:
+                try:
+                    self.render(snapshot)
+                    with self.lock:
+                        self.last_rendered = snapshot
+                    self.stats["rendered"] += 1
+                except Exception as e:
+                    print(f"UI render error: {e}")
+
+        if self.running:
+            self.after_id = self.root.after(self.interval_ms, self._drain)
+
+    def get_stats(self):
+        """Get publish/coalesce/render counters"""
+        with self.lock:
+            return dict(self.stats)
+
+
+class BackgroundTask:
+    """Handle given to a background job for progress and cancellation checks"""
+
+    def __init__(self, runner, key, generation):
+        self.runner = runner
+        self.key = key
+        self.generation = generation
+
+    @property
+    def cancelled(self):
+        """True once a newer request with the same key has been submitted"""
+        return not self.runner.is_current(self.key, self.generation)
+
+    def report(self, message):
+        """Send a status message to the main thread"""
+        self.runner._post(self, self.runner.on_status, message)
+
+
+class BackgroundTaskRunner:
+    """
+    Runs slow UI actions (analysis, capture + OCR) off the Tk main thread
+
+    Jobs are keyed: submitting a job supersedes any earlier job with the
+    same key, cancelling it if it has not started yet and discarding its
+    result and status messages if it has. Results, errors and status
+    messages are queued by the workers and delivered on the main thread
+    by a root.after poll, so callbacks may touch widgets freely.
+    """
+
+    def __init__(self, root, on_status=None, workers=2, poll_ms=50):
+        """
+        Args:
+            root: Tk root window that owns the main loop
+            on_status: Called on the main thread with status messages
+            workers: Number of worker threads
+            poll_ms: How often the main loop checks for finished jobs
+        """
+        self.root = root
+        self.on_status = on_status
+        self.poll_ms = poll_ms
+
+        self.pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ui-task")
+        self.completed = queue.Queue()
+
+        self.lock = threading.Lock()
+        self.generations = {}
+        self.futures = {}
+
+        self.after_id = self.root.after(self.poll_ms, self._poll)
+
+    def submit(self, key, fn, *args, on_done=None, on_error=None):
+        """
+        Run fn(task, *args) on a worker thread
+
+        Args:
+            key: Jobs with the same key supersede each other
+            fn: Job function; receives a BackgroundTask first
+            on_done: Called on the main thread with the job's result
+            on_error: Called on the main thread with the raised exception
+
+        Returns:
+            The BackgroundTask handle
+        """
+        with self.lock:
+            generation = self.generations.get(key, 0) + 1
+            self.generations[key] = generation
+
+            previous = self.futures.get(key)
+            if previous:
+                previous.cancel()
+
+            task = BackgroundTask(self, key, generation)
+            self.futures[key] = self.pool.submit(self._run, task, fn, args, on_done, on_error)
+
+        return task
+
+    def is_current(self, key, generation):
+        """Check whether a job is still the latest one for its key"""
+        with self.lock:
+            return self.generations.get(key) == generation
+
+    def _run(self, task, fn, args, on_done, on_error):
+        if task.cancelled:
+            return
+        try:
+            result = fn(task, *args)
+        except Exception as e:
+            self._post(task, on_error, e)
+        else:
+            self._post(task, on_done, result)
+
+    def _post(self, task, callback, value):
+        """Queue a callback for the main thread (safe from any thread)"""
+        if callback is not None:
+            self.completed.put((task, callback, value))
+
+    def _poll(self):
+        """Deliver queued callbacks of jobs that have not been superseded"""
+        while True:
+            try:
+                task, callback, value = self.completed.get_nowait()
+            except queue.Empty:
+                break
+
+            if task.cancelled:
+                continue
+            try:
+                callback(value)
+            except Exception as e:
+                print(f"UI task callback error: {e}")
+
+        self.after_id = self.root.after(self.poll_ms, self._poll)
+
+    def shutdown(self):
+        """Stop polling and cancel pending jobs"""
+        if self.after_id is not None:
+            self.root.after_cancel(self.after_id)
+            self.after_id = None
+        self.pool.shutdown(wait=False, cancel_futures=True)
@@ -3,6 +3,15 @@ from bs4 import BeautifulSoup
 import json
 import os
 from datetime import datetime, timedelta
+if __package__:
+    from .comp_index import CompIndex
+else:
+    from comp_index import CompIndex
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 class TFTDataScraper:
     """
@@ -13,16 +22,23 @@ class TFTDataScraper:
     2. MetaTFT (web scraping) - Meta compositions
     """
 
-    def __init__(self, cache_dir="data_cache"):
+    def __init__(self, cache_dir="data_cache", cdragon_source=None):
         self.cache_dir = cache_dir
         os.makedirs(cache_dir, exist_ok=True)
 
         # Community Dragon API endpoint (Riot's public CDN)
         self.cdragon_base = "https://raw.communitydragon.org/latest/cdragon/tft"
 
+        # en_us.json URL, or a local file path for offline use/testing
+        self.cdragon_source = cdragon_source or f"{self.cdragon_base}/en_us.json"
+
         # Cache expiry (update weekly)
         self.cache_expiry = timedelta(days=7)
 
+        # Champions/items/traits parsed from the current payload
+        self.cdragon_data = None
+        self.cdragon_data_mtime = None
+
     def get_champions_data(self):
         """
         Get champion data from Community Dragon
@@ -40,36 +56,7 @@ class TFTDataScraper:
         print("Fetching champion data from Community Dragon...")
 
         try:
-            # Get current set data
-            url = f"{self.cdragon_base}/en_us.json"
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
-
-            data = response.json()
-
-            # Extract champion info
-            champions = {}
-            if 'sets' in data:
-                latest_set = data['sets'][-1]  # Get latest set
-
-                for champ_key, champ_data in latest_set.get('champions', {}).items():
-                    champions[champ_data['name']] = {
-                        'cost': champ_data.get('cost', 1),
-                        'traits': champ_data.get('traits', []),
-                        'stats': {
-                            'hp': champ_data.get('stats', {}).get('hp', 0),
-                            'mana': champ_data.get('stats', {}).get('mana', 0),
-                            'armor': champ_data.get('stats', {}).get('armor', 0),
-                            'mr': champ_data.get('stats', {}).get('magicResist', 0),
-                            'damage': champ_data.get('stats', {}).get('damage', 0)
-                        }
-                    }
-
-            # Cache the data
-            with open(cache_file, 'w') as f:
-                json.dump(champions, f, indent=2)
-
-            return champions
+            return self._load_cdragon_data()['champions']
 
         except Exception as e:
             print(f"Failed to fetch champion data: {e}")
@@ -91,32 +78,162 @@ class TFTDataScraper:
         print("Fetching item data...")
 
         try:
-            url = f"{self.cdragon_base}/en_us.json"
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
+            return self._load_cdragon_data()['items']
 
-            data = response.json()
+        except Exception as e:
+            print(f"Failed to fetch item data: {e}")
+            return {}
 
-            items = {}
-            if 'sets' in data:
-                latest_set = data['sets'][-1]
+    def get_traits_data(self):
+        """
+        Get trait data
 
-                for item_id, item_data in latest_set.get('items', {}).items():
-                    items[item_data['name']] = {
-                        'effects': item_data.get('effects', {}),
-                        'description': item_data.get('desc', ''),
-                        'from': item_data.get('from', [])  # Component items
-                    }
+        Returns:
+            dict: Trait descriptions and breakpoint effects
+        """
+        cache_file = os.path.join(self.cache_dir, "traits.json")
 
-            with open(cache_file, 'w') as f:
-                json.dump(items, f, indent=2)
+        if self._is_cache_valid(cache_file):
+            with open(cache_file, 'r') as f:
+                return json.load(f)
 
-            return items
+        print("Fetching trait data...")
+
+        try:
+            return self._load_cdragon_data()['traits']
 
         except Exception as e:
-            print(f"Failed to fetch item data: {e}")
+            print(f"Failed to fetch trait data: {e}")
             return {}
 
+    def _load_cdragon_data(self):
+        """
+        Get champions, items and traits from en_us.json
+
+        The payload is downloaded at most once per cache period and parsed
+        once; all three sections are extracted in the same pass and cached.
+        """
+        payload_file = self._get_cdragon_payload()
+        mtime = os.path.getmtime(payload_file)
+
+        if self.cdragon_data is None or self.cdragon_data_mtime != mtime:
+            self.cdragon_data = self._parse_cdragon_payload(payload_file)
+            self.cdragon_data_mtime = mtime
+
+            for section, data in self.cdragon_data.items():
+                with open(os.path.join(self.cache_dir, f"{section}.json"), 'w') as f:
+                    json.dump(data, f, indent=2)
+
+        return self.cdragon_data
+
+    def _get_cdragon_payload(self):
+        """Path of the raw en_us.json, streaming it to disk if needed"""
+        if not self.cdragon_source.startswith(("http://", "https://")):
+            return self.cdragon_source
+
+        payload_file = os.path.join(self.cache_dir, "en_us.json")
+
+        # The sidecar's mtime marks the last download or revalidation; the
+        # payload's own mtime only changes with its content, so a 304 never
+        # forces a re-parse
+        meta_file = payload_file + ".meta"
+        if os.path.exists(payload_file) and self._is_cache_valid(meta_file):
+            return payload_file
+
+        # Revalidate an expired copy instead of downloading it again
+        headers = {}
+        if os.path.exists(payload_file) and os.path.exists(meta_file):
+            with open(meta_file, 'r') as f:
+                meta = json.load(f)
+            if meta.get('etag'):
+                headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                headers['If-Modified-Since'] = meta['last_modified']
+
+        response = requests.get(self.cdragon_source, headers=headers, timeout=10, stream=True)
+        if response.status_code == 304:
+            # Still current: start a new cache period for the payload and
+            # the sections already extracted from it
+            for section in ('champions', 'items', 'traits'):
+                section_file = os.path.join(self.cache_dir, f"{section}.json")
+                if os.path.exists(section_file):
+                    os.utime(section_file, None)
+            os.utime(meta_file, None)
+            return payload_file
+        response.raise_for_status()
+
+        # Write to a temp file first so a failed download never replaces a good one
+        partial_file = payload_file + ".part"
+        with open(partial_file, 'wb') as f:
+            for chunk in response.iter_content(chunk_size=1 << 16):
+                f.write(chunk)
+        os.replace(partial_file, payload_file)
+
+        with open(meta_file, 'w') as f:
+            json.dump({
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified')
+            }, f)
+
+        return payload_file
+
+    def _parse_cdragon_payload(self, payload_file):
+        """
+        Extract the latest set's champions, items and traits in one pass
+
+        With ijson installed the file is streamed one set at a time, so the
+        whole document never has to be held in memory.
+        """
+        latest_set = None
+
+        with open(payload_file, 'rb') as f:
+            if ijson is not None:
+                for tft_set in ijson.items(f, 'sets.item', use_float=True):
+                    latest_set = tft_set
+            else:
+                data = json.load(f)
+                if 'sets' in data:
+                    latest_set = data['sets'][-1]  # Get latest set
+
+        champions = {}
+        items = {}
+        traits = {}
+
+        if latest_set:
+            for champ_data in self._entries(latest_set.get('champions')):
+                champions[champ_data['name']] = {
+                    'cost': champ_data.get('cost', 1),
+                    'traits': champ_data.get('traits', []),
+                    'stats': {
+                        'hp': champ_data.get('stats', {}).get('hp', 0),
+                        'mana': champ_data.get('stats', {}).get('mana', 0),
+                        'armor': champ_data.get('stats', {}).get('armor', 0),
+                        'mr': champ_data.get('stats', {}).get('magicResist', 0),
+                        'damage': champ_data.get('stats', {}).get('damage', 0)
+                    }
+                }
+
+            for item_data in self._entries(latest_set.get('items')):
+                items[item_data['name']] = {
+                    'effects': item_data.get('effects', {}),
+                    'description': item_data.get('desc', ''),
+                    'from': item_data.get('from', [])  # Component items
+                }
+
+            for trait_data in self._entries(latest_set.get('traits')):
+                traits[trait_data['name']] = {
+                    'description': trait_data.get('desc', ''),
+                    'effects': trait_data.get('effects', [])
+                }
+
+        return {'champions': champions, 'items': items, 'traits': traits}
+
+    def _entries(self, collection):
+        """Values of a keyed dict or items of a list section"""
+        if isinstance(collection, dict):
+            return list(collection.values())
+        return collection or []
+
     def get_meta_comps(self):
         """
         Scrape meta compositions from MetaTFT
@@ -229,6 +346,7 @@ class TFTDataScraper:
         print("Updating all TFT data...")
         self.get_champions_data()
         self.get_items_data()
+        self.get_traits_data()
         self.get_meta_comps()
         print("Data update complete!")
 
@@ -241,12 +359,14 @@ class DataManager:
         self.champions = None
         self.items = None
         self.meta_comps = None
+        self.comp_index = None
 
     def load_data(self):
         """Load all data"""
         self.champions = self.scraper.get_champions_data()
         self.items = self.scraper.get_items_data()
         self.meta_comps = self.scraper.get_meta_comps()
+        self.comp_index = CompIndex(self.meta_comps)
 
     def get_champion_info(self, name):
         """Get info for a specific champion"""
@@ -261,17 +381,14 @@ class DataManager:
 
         recommendations = []
 
-        for comp in self.meta_comps:
-            # Count how many units from meta comp you have
-            matches = len(set(current_units) & set(comp['units']))
-
-            if matches > 0:
-                recommendations.append({
-                    'comp': comp['name'],
-                    'matches': matches,
-                    'missing': list(set(comp['units']) - set(current_units)),
-                    'tier': comp['tier']
-                })
+        # Only comps sharing a unit with the board are visited
+        for comp, matches, missing in self.comp_index.match(current_units):
+            recommendations.append({
+                'comp': comp['name'],
+                'matches': matches,
+                'missing': missing,
+                'tier': comp['tier']
+            })
 
         # Sort by matches
         recommendations.sort(key=lambda x: x['matches'], reverse=True)
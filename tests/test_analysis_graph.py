@@ -0,0 +1,84 @@
+import pytest
+
+from utilities.analysis_graph import AnalysisGraph
+from utilities.game_state import GameState
+
+
+def build_graph(calls):
+    graph = AnalysisGraph()
+
+    def node(name, compute):
+        def run(state, *inputs):
+            calls.append(name)
+            return compute(state, *inputs)
+        return run
+
+    graph.add_node("gold", node("gold", lambda s: s.gold * 2), fields=("gold",))
+    graph.add_node("health", node("health", lambda s: s.health < 30), fields=("health",))
+    graph.add_node("synergies", node("synergies", lambda s: sorted(s.synergies)), fields=("synergies",))
+    graph.add_node("summary", node("summary", lambda s, gold, synergies: (gold, synergies)),
+                   depends_on=("gold", "synergies"))
+    return graph
+
+
+def test_first_run_computes_everything():
+    calls = []
+    graph = build_graph(calls)
+    state = GameState()
+    state.gold = 10
+
+    values = graph.run(state)
+
+    assert calls == ["gold", "health", "synergies", "summary"]
+    assert values["summary"] == (20, [])
+
+
+def test_unchanged_state_reuses_memoized_values():
+    calls = []
+    graph = build_graph(calls)
+    state = GameState()
+    graph.run(state)
+    calls.clear()
+
+    graph.run(state)
+
+    assert calls == []
+    assert graph.get_last_recomputed() == []
+
+
+def test_changes_propagate_to_dependents_only():
+    calls = []
+    graph = build_graph(calls)
+    state = GameState()
+    graph.run(state)
+
+    state.health = 10
+    graph.run(state)
+    assert graph.get_last_recomputed() == ["health"]
+
+    # In-place mutation of a container field is detected too
+    state.synergies["Mystic"] = 2
+    values = graph.run(state)
+    assert graph.get_last_recomputed() == ["synergies", "summary"]
+    assert values["summary"] == (0, ["Mystic"])
+
+
+def test_invalidate_forces_recompute():
+    calls = []
+    graph = build_graph(calls)
+    state = GameState()
+    graph.run(state)
+
+    graph.invalidate("gold")
+    graph.run(state)
+    assert graph.get_last_recomputed() == ["gold", "summary"]
+
+    graph.invalidate()
+    graph.run(state)
+    assert graph.get_last_recomputed() == ["gold", "health", "synergies", "summary"]
+
+
+def test_unknown_dependency_is_rejected():
+    graph = AnalysisGraph()
+    with pytest.raises(ValueError):
+        graph.add_node("summary", lambda s, gold: gold, depends_on=("gold",))
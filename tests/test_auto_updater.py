@@ -0,0 +1,118 @@
+import queue
+import threading
+import time
+
+import pytest
+
+from utilities import auto_updater
+from utilities.game_state import GameState
+from utilities.phase_scheduler import PhaseScheduler
+
+
+class FakeScreenCapture:
+    pass
+
+
+@pytest.fixture
+def updater(monkeypatch):
+    monkeypatch.setattr(auto_updater, 'ScreenCapture', FakeScreenCapture)
+    return auto_updater.AutoUpdater(GameState())
+
+
+def test_default_hud_interval_comes_from_scheduler(updater):
+    assert updater.update_interval == PhaseScheduler.DEFAULT_INTERVALS['planning']['hud']
+    assert updater.scheduler.intervals['combat']['hud'] == PhaseScheduler.DEFAULT_INTERVALS['combat']['hud']
+
+    updater.set_update_interval(3.0)
+    assert updater.scheduler.intervals['planning']['hud'] == 3.0
+
+
+def test_dropped_capture_keeps_its_regions_and_dirty_flags(updater):
+    slot = queue.Queue(maxsize=1)
+    updater._offer(slot, {'rois': {'shop': 's1', 'gold': 'g1'}, 'dirty': {'shop': True, 'gold': False}, 'captured_at': 1}, 'capture')
+    updater._offer(slot, {'rois': {'gold': 'g2'}, 'dirty': {'gold': True}, 'captured_at': 2}, 'capture')
+
+    frame = slot.get_nowait()
+    assert frame['rois'] == {'gold': 'g2', 'shop': 's1'}
+    assert frame['dirty'] == {'gold': True, 'shop': True}
+    assert updater.get_pipeline_stats()['dropped']['capture'] == 1
+
+
+def test_dropped_readings_merge_per_field(updater):
+    slot = queue.Queue(maxsize=1)
+    updater._offer(slot, {'hud': {'gold': {'value': 10}, 'level': {'value': 3}}, 'shop_units': ['Ahri'], 'captured_at': 1}, 'vision')
+    updater._offer(slot, {'hud': {'level': {'value': 4}, 'gold': {'value': None}}, 'shop_units': None, 'captured_at': 2}, 'vision')
+
+    readings = slot.get_nowait()
+    assert readings['hud'] == {'gold': {'value': 10}, 'level': {'value': 4}}
+    assert readings['shop_units'] == ['Ahri']
+    assert readings['captured_at'] == 2
+
+
+def test_scheduler_phases_and_due_groups():
+    scheduler = PhaseScheduler(planning_duration=30.0)
+    assert scheduler.observe('', now=1000.0) == 'unknown'
+    assert scheduler.due_groups(now=1000.0) == {'hud', 'shop'}
+
+    assert scheduler.observe('3-2', now=1100.0) == 'planning'
+    assert scheduler.due_groups(now=1100.0) == {'hud', 'shop'}
+    scheduler.mark_polled({'hud', 'shop'}, now=1100.0)
+    assert scheduler.due_groups(now=1100.3) == {'shop'}
+
+    assert scheduler.observe('3-2', {'shop_brightness': 10.0}, now=1140.0) == 'combat'
+    assert scheduler.observe('3-4', now=1150.0) == 'carousel'
+    assert scheduler.due_groups(now=1150.0) == {'hud'}
+
+    assert scheduler.observe('3-4', {'hud_brightness': 5.0}, now=1151.0) == 'loading'
+    assert [t['to'] for t in scheduler.get_decisions()['history']] == ['planning', 'combat', 'carousel', 'loading']
+
+
+def test_unreadable_stage_keeps_polling_the_shop():
+    scheduler = PhaseScheduler()
+
+    # Bright HUD but the stage box never OCRs: not a loading screen
+    for tick in range(600):
+        scheduler.observe('', {'hud_brightness': 120.0}, now=1000.0 + tick)
+    assert scheduler.phase == 'unknown'
+    assert scheduler.due_groups(now=1600.0) == {'hud', 'shop'}
+
+    assert scheduler.observe('', {'hud_brightness': 5.0}, now=1601.0) == 'loading'
+    assert scheduler.due_groups(now=1601.0) == {'hud'}
+
+
+def test_user_interval_applies_without_a_stage(updater):
+    updater.set_update_interval(4.0)
+
+    assert updater.scheduler.intervals['unknown']['hud'] == 4.0
+
+
+def test_restart_does_not_revive_a_slow_old_pipeline(updater, capsys):
+    release = threading.Event()
+    reads = []
+
+    def read_hud_fields(fields, changed=None):
+        reads.append(threading.current_thread().name)
+        release.wait(5)
+        return {'level': {'value': 5}}
+
+    frames = iter(range(1000000))
+    updater._capture_frame = lambda groups: {'rois': {'level': next(frames)}, 'dirty': {'level': True}, 'captured_at': time.time()}
+    updater.ocr_reader.read_hud_fields = read_hud_fields
+
+    updater.start()
+    old_threads = list(updater.threads)
+    while not reads:
+        time.sleep(0.01)
+
+    # The old vision stage is stuck inside OCR when the pipeline restarts
+    updater.stop(timeout=0.1)
+    updater.start()
+    release.set()
+
+    for thread in old_threads:
+        thread.join(2)
+    assert not any(thread.is_alive() for thread in old_threads)
+    assert all(thread.is_alive() for thread in updater.threads)
+
+    updater.stop()
+    assert "cannot schedule new futures" not in capsys.readouterr().out
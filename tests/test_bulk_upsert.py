@@ -0,0 +1,111 @@
+import sqlite3
+
+import pytest
+
+from src.database.db_manager import DatabaseManager
+from src.scrapers.orchestrator import ScrapingOrchestrator
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "db" / "tft.db")
+
+
+@pytest.fixture
+def db(db_path):
+    return DatabaseManager(db_path)
+
+
+def test_composition_counts_and_values(db):
+    counts = db.bulk_upsert_compositions([
+        {'name': 'Mystics', 'tier': 'A', 'win_rate': 51.0, 'champions': ['Ahri']},
+        {'name': 'Knights', 'tier': 'B', 'win_rate': 49.0, 'champions': ['Garen']},
+    ])
+    assert counts == {'inserted': 2, 'updated': 0}
+
+    counts = db.bulk_upsert_compositions([
+        {'name': 'Mystics', 'tier': 'S', 'win_rate': 55.0, 'champions': ['Ahri', 'Lux']},
+        {'name': 'Rangers', 'tier': 'C', 'win_rate': 45.0, 'champions': ['Jinx']},
+    ])
+    assert counts == {'inserted': 1, 'updated': 1}
+
+    comps = {comp['name']: comp for comp in db.get_top_comps(limit=10)}
+    assert set(comps) == {'Mystics', 'Knights', 'Rangers'}
+    assert comps['Mystics']['tier'] == 'S'
+    assert comps['Mystics']['champions'] == ['Ahri', 'Lux']
+
+
+def test_same_name_in_another_patch_is_a_new_row(db):
+    db.bulk_upsert_compositions([{'name': 'Mystics', 'tier': 'A'}])
+
+    counts = db.bulk_upsert_compositions([{'name': 'Mystics', 'tier': 'B', 'patch': '14.1'}])
+
+    assert counts == {'inserted': 1, 'updated': 0}
+
+
+def test_duplicates_within_a_batch_count_once(db):
+    counts = db.bulk_upsert_items([
+        {'name': 'Infinity Edge', 'priority_score': 8.0},
+        {'name': 'Infinity Edge', 'priority_score': 9.0},
+        {'name': 'Blue Buff', 'priority_score': 7.0},
+    ])
+
+    assert counts == {'inserted': 2, 'updated': 1}
+    assert db.get_item('Infinity Edge')['priority_score'] == 9.0
+
+
+def test_records_with_different_keys_keep_other_columns(db):
+    db.bulk_upsert_augments([{'name': 'Featherweights', 'tier': 'Gold', 'win_rate': 52.0}])
+
+    counts = db.bulk_upsert_augments([
+        {'name': 'Featherweights', 'win_rate': 54.0},
+        {'name': 'Combat Training', 'tier': 'Silver'},
+    ])
+
+    assert counts == {'inserted': 1, 'updated': 1}
+    augment = db.get_augment('Featherweights')
+    assert (augment['tier'], augment['win_rate']) == ('Gold', 54.0)
+
+
+def test_unknown_columns_reject_the_batch(db):
+    with pytest.raises(ValueError):
+        db.bulk_upsert_items([{'name': 'Infinity Edge'}, {'name': 'Blue Buff', 'bogus': 1}])
+
+    assert db.get_item('Infinity Edge') is None
+
+
+def test_empty_batch(db):
+    assert db.bulk_upsert_items([]) == {'inserted': 0, 'updated': 0}
+
+
+def test_orchestrator_saves_good_records_when_the_batch_fails(db, capsys):
+    orchestrator = ScrapingOrchestrator(db, scraper=object())
+
+    orchestrator._save("items", db.bulk_upsert_items, [
+        {'name': 'Infinity Edge', 'priority_score': 9.0},
+        {'name': 'Blue Buff', 'bogus': 1},
+        {'name': 'Guardian Angel'},
+    ])
+
+    assert db.get_item('Infinity Edge') is not None
+    assert db.get_item('Guardian Angel') is not None
+    assert db.get_item('Blue Buff') is None
+    assert "Saved items: 2 new, 0 updated" in capsys.readouterr().out
+
+
+def test_duplicate_comps_are_migrated_once(db_path):
+    DatabaseManager(db_path)
+
+    conn = sqlite3.connect(db_path)
+    conn.execute("DROP INDEX uq_compositions_name_patch")
+    conn.execute("INSERT INTO compositions (name, patch, tier) VALUES ('Mystics', 'current', 'B'), ('Mystics', 'current', 'S')")
+    conn.commit()
+    conn.close()
+
+    db = DatabaseManager(db_path)
+    assert db.get_composition('Mystics')['tier'] == 'S'
+
+    conn = sqlite3.connect(db_path)
+    assert conn.execute("SELECT COUNT(*) FROM compositions").fetchone() == (1,)
+    assert conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'uq_compositions_name_patch'").fetchone() == (1,)
+    conn.close()
@@ -0,0 +1,74 @@
+import pytest
+
+from src.database.db_manager import DatabaseManager
+from src.database.models import Champion
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = DatabaseManager(str(tmp_path / "db" / "tft.db"))
+    db.bulk_upsert_compositions([
+        {'name': 'Mystics', 'tier': 'A', 'champions': ['Ahri', 'Lux'], 'positioning': {'Ahri': [0, 3]}},
+    ])
+    db.bulk_upsert_items([{'name': 'Blue Buff', 'priority_score': 7.0, 'components': ['Tear', 'Tear']}])
+    return db
+
+
+def test_lookups_are_served_from_one_load(db, monkeypatch):
+    loads = []
+    load = db.catalog._load
+    monkeypatch.setattr(db.catalog, '_load', lambda: loads.append(1) or load())
+
+    assert db.get_composition('Mystics')['tier'] == 'A'
+    assert db.get_item('Blue Buff')['components'] == ['Tear', 'Tear']
+    assert db.get_item('Missing') is None
+
+    assert len(loads) == 1
+
+
+def test_writes_invalidate_the_cache(db):
+    assert db.get_item('Blue Buff')['priority_score'] == 7.0
+
+    db.bulk_upsert_items([{'name': 'Blue Buff', 'priority_score': 9.5}])
+    assert db.get_item('Blue Buff')['priority_score'] == 9.5
+
+    with db.catalog_write_scope() as session:
+        session.add(Champion(name='Ahri', cost=4, traits=['Mystic'], stats={'hp': 700}))
+    assert db.get_champion('Ahri')['traits'] == ['Mystic']
+
+
+def test_session_scope_writes_need_an_explicit_invalidate(db):
+    db.get_item('Blue Buff')
+
+    with db.session_scope() as session:
+        session.add(Champion(name='Lux', cost=3))
+    assert db.get_champion('Lux') is None
+
+    db.catalog.invalidate()
+    assert db.get_champion('Lux')['cost'] == 3
+
+
+def test_callers_cannot_change_each_others_entries(db):
+    comp = db.get_composition('Mystics')
+    comp['champions'].append('Teemo')
+    comp['positioning']['Ahri'][0] = 9
+    comp['tier'] = 'D'
+
+    again = db.get_composition('Mystics')
+    assert again['champions'] == ['Ahri', 'Lux']
+    assert again['positioning'] == {'Ahri': [0, 3]}
+    assert again['tier'] == 'A'
+
+    items = db.catalog.get_all('items')
+    items[0]['components'].clear()
+    assert db.get_item('Blue Buff')['components'] == ['Tear', 'Tear']
+
+
+@pytest.mark.parametrize('folder', ['my#data', 'fifty%25', 'what?now', 'with space'])
+def test_read_pool_opens_paths_with_uri_characters(tmp_path, folder):
+    db = DatabaseManager(str(tmp_path / folder / "tft.db"))
+    db.bulk_upsert_items([{'name': 'Blue Buff', 'priority_score': 7.0}])
+
+    assert db.get_item('Blue Buff')['priority_score'] == 7.0
+    assert db.get_top_items(limit=1)[0]['name'] == 'Blue Buff'
+    assert sorted(p.name for p in tmp_path.iterdir()) == [folder]
@@ -0,0 +1,37 @@
+import numpy as np
+
+from utilities.change_detector import ChangeDetector
+
+
+def frame(value, shape=(32, 64, 3)):
+    return np.full(shape, value, dtype=np.uint8)
+
+
+def test_first_sight_is_dirty_then_clean():
+    detector = ChangeDetector()
+    assert detector.update({'gold': frame(100)}) == {'gold': True}
+    assert detector.update({'gold': frame(100)}) == {'gold': False}
+
+
+def test_small_noise_is_ignored_and_real_change_is_dirty():
+    detector = ChangeDetector()
+    detector.update({'gold': frame(100)})
+
+    assert detector.update({'gold': frame(110)}) == {'gold': False}
+    assert detector.update({'gold': frame(200)}) == {'gold': True}
+
+
+def test_slow_drift_accumulates_against_last_changed_baseline():
+    detector = ChangeDetector()
+    detector.update({'shop': frame(100)})
+
+    results = [detector.update({'shop': frame(100 + step * 10)})['shop'] for step in range(1, 4)]
+    assert results == [False, False, True]
+
+
+def test_invalidate_forces_dirty():
+    detector = ChangeDetector()
+    detector.update({'gold': frame(100), 'level': frame(50)})
+    detector.invalidate('gold')
+
+    assert detector.update({'gold': frame(100), 'level': frame(50)}) == {'gold': True, 'level': False}
@@ -0,0 +1,76 @@
+import random
+
+from utilities.comp_index import CompIndex
+
+COMPS = [
+    {'name': 'Mystics', 'tier': 'S', 'units': ['Ahri', 'Lux', 'Karma', 'Lux']},
+    {'name': 'Knights', 'tier': 'A', 'units': ['Garen', 'Poppy', 'Leona']},
+    {'name': 'Mixed', 'tier': 'B', 'units': ['Ahri', 'Garen', 'Jinx']},
+    {'name': 'Empty', 'tier': 'C', 'units': []},
+]
+
+
+def reference_match(comps, current_units):
+    """Set-based matching used before the index"""
+    results = []
+    for comp in comps:
+        matches = len(set(current_units) & set(comp['units']))
+        if matches > 0:
+            results.append((comp['name'], matches, set(comp['units']) - set(current_units)))
+    return results
+
+
+def as_comparable(results):
+    return [(comp['name'], matches, set(missing)) for comp, matches, missing in results]
+
+
+def test_match_counts_and_missing_units():
+    index = CompIndex(COMPS)
+
+    results = index.match(['Ahri', 'Garen', 'Teemo'])
+
+    assert [(comp['name'], matches, missing) for comp, matches, missing in results] == [
+        ('Mystics', 1, ['Lux', 'Karma']),
+        ('Knights', 1, ['Poppy', 'Leona']),
+        ('Mixed', 2, ['Jinx']),
+    ]
+
+
+def test_no_shared_units_means_no_results():
+    index = CompIndex(COMPS)
+
+    assert index.match([]) == []
+    assert index.match(['Teemo']) == []
+
+
+def test_duplicate_units_count_once():
+    index = CompIndex(COMPS)
+
+    results = index.match(['Lux', 'Lux'])
+
+    assert as_comparable(results) == [('Mystics', 1, {'Ahri', 'Karma'})]
+    assert index.unit_comps['Lux'] == [0]
+
+
+def test_custom_units_key():
+    comps = [{'name': c['name'], 'champions': c['units']} for c in COMPS]
+    index = CompIndex(comps, units_key='champions')
+
+    assert as_comparable(index.match(['Leona'])) == [('Knights', 1, {'Garen', 'Poppy'})]
+
+
+def test_mask_round_trip():
+    index = CompIndex(COMPS)
+
+    assert set(index.units_of(index.mask_of(['Jinx', 'Ahri', 'Teemo']))) == {'Jinx', 'Ahri'}
+
+
+def test_matches_set_based_reference():
+    rng = random.Random(0)
+    pool = [f"Unit{i}" for i in range(60)]
+    comps = [{'name': f"Comp{i}", 'tier': 'A', 'units': rng.sample(pool, rng.randint(0, 9))} for i in range(40)]
+    index = CompIndex(comps)
+
+    for _ in range(300):
+        board = rng.sample(pool + ['Unknown'], rng.randint(0, 10))
+        assert as_comparable(index.match(board)) == reference_match(comps, board)
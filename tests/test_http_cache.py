@@ -0,0 +1,161 @@
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.database.db_manager import DatabaseManager
+from src.scrapers import base_scraper
+from src.scrapers.metatft_scraper import MetaTFTScraper
+from src.scrapers.orchestrator import ScrapingOrchestrator
+from src.utilities.web_scraper import TFTDataScraper
+
+COMPS_PAGE = """
+<div class="comp-card"><h3>Mystics</h3><span class="tier-badge">S</span>
+  <span class="champion-name">Ahri</span><span class="champion-name">Lux</span></div>
+<div class="comp-card"><h3>Knights</h3><span class="tier-badge">A</span>
+  <span class="champion-name">Garen</span></div>
+"""
+
+CDRAGON_PAYLOAD = json.dumps({"sets": [{
+    "champions": [{"name": "Ahri", "cost": 4, "traits": ["Mystic"]}],
+    "items": [{"name": "Blue Buff", "desc": "Mana"}],
+    "traits": [{"name": "Mystic", "desc": "MR"}]
+}]})
+
+
+class FixtureServer:
+    """Local stand-in that serves fixed pages with an ETag and honours If-None-Match"""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.requests = []
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server.requests.append((self.path, self.headers.get('If-None-Match')))
+                body = server.pages[self.path].encode('utf-8')
+                etag = f'"{len(body)}"'
+
+                if self.headers.get('If-None-Match') == etag:
+                    self.send_response(304)
+                    self.end_headers()
+                    return
+
+                self.send_response(200)
+                self.send_header('ETag', etag)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_port}"
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+
+    def conditional_requests(self):
+        """Whether each request carried If-None-Match, in order"""
+        return [etag is not None for _, etag in self.requests]
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture
+def server():
+    server = FixtureServer({'/comps': COMPS_PAGE, '/en_us.json': CDRAGON_PAYLOAD})
+    yield server
+    server.close()
+
+
+@pytest.fixture
+def scraper(server, tmp_path):
+    # Zero cache duration so every scrape revalidates against the server
+    return MetaTFTScraper(server.url, cache_duration_hours=0, requests_per_second=100.0,
+                          cache_dir=str(tmp_path / "http_cache"))
+
+
+def test_200_is_stored_unparsed(server, scraper):
+    url = f"{server.url}/comps"
+
+    assert scraper.fetch_page(url) is not None
+
+    meta = scraper.http_cache.get_metadata(url)
+    assert meta['etag'] and meta['parsed'] is False
+    assert scraper.http_cache.load_body(url) == COMPS_PAGE
+
+
+def test_304_after_a_successful_parse_skips_parsing_and_saving(server, scraper, tmp_path):
+    db = DatabaseManager(str(tmp_path / "db" / "tft.db"))
+    orchestrator = ScrapingOrchestrator(db, scraper=scraper)
+
+    assert [comp['name'] for comp in scraper.scrape_compositions()] == ['Mystics', 'Knights']
+    assert scraper.http_cache.is_parsed(f"{server.url}/comps")
+
+    version = db.data_version
+    orchestrator._save("compositions", db.bulk_upsert_compositions, scraper.scrape_compositions())
+
+    assert server.requests[-1] == ('/comps', scraper.http_cache.get_metadata(f"{server.url}/comps")['etag'])
+    assert db.data_version == version
+    assert db.get_composition('Mystics') is None
+
+
+def test_304_after_a_failed_parse_reparses_the_cached_body(server, scraper, monkeypatch):
+    parse = base_scraper.BeautifulSoup
+    failures = []
+
+    def broken_once(text, parser):
+        if not failures:
+            failures.append(text)
+            raise ValueError("parser blew up")
+        return parse(text, parser)
+
+    monkeypatch.setattr(base_scraper, 'BeautifulSoup', broken_once)
+
+    # Failed parse: fallback data, cache entry stays unparsed
+    assert [comp['name'] for comp in scraper.scrape_compositions()] == ['Reroll Comp', 'Fast 8 Comp']
+    assert not scraper.http_cache.is_parsed(f"{server.url}/comps")
+
+    # Server says 304, the cached body is parsed instead
+    assert [comp['name'] for comp in scraper.scrape_compositions()] == ['Mystics', 'Knights']
+    assert scraper.http_cache.is_parsed(f"{server.url}/comps")
+
+    assert scraper.scrape_compositions() == []
+    assert server.conditional_requests() == [False, True, True]
+
+
+def test_forced_scrape_ignores_validators(server, scraper):
+    scraper.scrape_compositions()
+
+    assert len(scraper.scrape_compositions(force=True)) == 2
+    assert server.requests[-1] == ('/comps', None)
+
+
+def test_cdragon_304_does_not_reparse_the_payload(server, tmp_path):
+    data_scraper = TFTDataScraper(str(tmp_path / "data_cache"), cdragon_source=f"{server.url}/en_us.json")
+    assert data_scraper.get_champions_data()['Ahri']['cost'] == 4
+
+    # Age the validation marker and the extracted sections past the expiry
+    old = time.time() - 8 * 24 * 3600
+    for name in ('en_us.json.meta', 'champions.json', 'items.json', 'traits.json'):
+        os.utime(tmp_path / "data_cache" / name, (old, old))
+    payload_mtime = os.path.getmtime(tmp_path / "data_cache" / "en_us.json")
+
+    parses = []
+    parse = data_scraper._parse_cdragon_payload
+    data_scraper._parse_cdragon_payload = lambda path: parses.append(path) or parse(path)
+
+    assert data_scraper.get_champions_data()['Ahri']['cost'] == 4
+    assert data_scraper.get_items_data() == {'Blue Buff': {'effects': {}, 'description': 'Mana', 'from': []}}
+
+    assert parses == []
+    assert server.conditional_requests() == [False, True]
+    assert os.path.getmtime(tmp_path / "data_cache" / "en_us.json") == payload_mtime
+    assert data_scraper._is_cache_valid(str(tmp_path / "data_cache" / "traits.json"))
@@ -0,0 +1,23 @@
+import glob
+import importlib
+import os
+
+import pytest
+
+from conftest import ROOT
+
+UTILITIES = sorted(
+    os.path.splitext(os.path.basename(path))[0]
+    for path in glob.glob(os.path.join(ROOT, 'src', 'utilities', '*.py'))
+    if not path.endswith('__init__.py')
+)
+
+
+@pytest.mark.parametrize('module', UTILITIES)
+def test_utilities_package_import(module):
+    importlib.import_module(f'utilities.{module}')
+
+
+@pytest.mark.parametrize('module', ['src.utilities.web_scraper', 'src.utilities.champion_recognizer'])
+def test_src_package_import(module):
+    importlib.import_module(module)
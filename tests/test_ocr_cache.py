@@ -0,0 +1,67 @@
+import numpy as np
+
+from utilities.ocr_backend import OCRBackend, OCRResultCache
+
+
+class CountingEngine:
+    def __init__(self):
+        self.calls = 0
+
+    def image_to_string(self, img, config=""):
+        self.calls += 1
+        return f"text{int(img.mean())}"
+
+    def image_to_text_and_confidence(self, img, config=""):
+        self.calls += 1
+        return f"text{int(img.mean())}", 90.0
+
+
+def make_backend(cache_size=512):
+    backend = OCRBackend(workers=2, cache_size=cache_size)
+    backend.engine = CountingEngine()
+    return backend
+
+
+def test_identical_pixels_hit_the_cache():
+    backend = make_backend()
+    img = np.full((10, 20), 7, dtype=np.uint8)
+
+    assert backend.image_to_string(img, "--psm 7") == "text7"
+    assert backend.image_to_string(img.copy(), "--psm 7") == "text7"
+
+    assert backend.engine.calls == 1
+    stats = backend.get_cache_stats()
+    assert (stats['hits'], stats['misses'], stats['size']) == (1, 1, 1)
+
+
+def test_config_shape_and_kind_are_part_of_the_key():
+    backend = make_backend()
+    img = np.full((10, 20), 7, dtype=np.uint8)
+
+    backend.image_to_string(img, "--psm 7")
+    backend.image_to_string(img, "--psm 8")
+    backend.image_to_string(img.reshape(20, 10), "--psm 7")
+    backend.image_to_text_and_confidence(img, "--psm 7")
+
+    assert backend.engine.calls == 4
+
+
+def test_map_results_stay_in_input_order():
+    backend = make_backend()
+    images = [np.full((4, 4), value, dtype=np.uint8) for value in (1, 2, 1, 3)]
+
+    assert backend.map(images) == ["text1", "text2", "text1", "text3"]
+    assert backend.engine.calls <= 4
+
+
+def test_lru_evicts_least_recently_used():
+    cache = OCRResultCache(max_entries=2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    cache.get('a')
+    cache.put('c', 3)
+
+    assert cache.get('b') is None
+    assert cache.get('a') == 1
+    assert cache.get('c') == 3
+    assert cache.get_stats()['size'] == 2
@@ -0,0 +1,88 @@
+from PIL import Image
+
+from utilities.ocr_reader import OCRReader
+
+
+class FakeBackend:
+    """Returns canned (text, confidence) readings per HUD field"""
+
+    def __init__(self, readings):
+        self.readings = readings
+        self.calls = []
+
+    def map_with_confidence(self, images, configs):
+        fields = [img.info['field'] for img in images]
+        self.calls.extend(fields)
+        return [self.readings[field] for field in fields]
+
+    def image_to_string(self, img, config=""):
+        return "no keywords here"
+
+
+class NoGlyphs:
+    min_confidence = 0.8
+
+    def read_number(self, img):
+        return None, 0.0
+
+
+def make_reader(readings):
+    reader = OCRReader()
+    reader.backend = FakeBackend(readings)
+    reader.digit_recognizer = NoGlyphs()
+
+    # Tag each preprocessed box with its field so the fake backend can answer
+    def preprocess(img):
+        out = img.copy()
+        out.info['field'] = img.info['field']
+        return out
+    reader._preprocess_hud_field = preprocess
+    return reader
+
+
+def boxes(*names):
+    fields = {}
+    for name in names:
+        img = Image.new('L', (10, 10))
+        img.info['field'] = name
+        fields[name] = img
+    return fields
+
+
+def test_valid_readings_pass():
+    reader = make_reader({"level": ("7", 91.0), "gold": ("54", 88.0), "health": ("0", 90.0), "stage": ("4-2", 85.0)})
+
+    hud = reader.read_hud_fields(boxes("level", "gold", "health", "stage"))
+
+    assert {field: reading["value"] for field, reading in hud.items()} == {
+        "level": 7, "gold": 54, "health": 0, "stage": "4-2"
+    }
+
+
+def test_out_of_range_and_low_confidence_readings_are_rejected():
+    reader = make_reader({"level": ("47", 95.0), "gold": ("12", 30.0), "health": ("180", 95.0), "stage": ("13-9", 95.0)})
+
+    hud = reader.read_hud_fields(boxes("level", "gold", "health", "stage"))
+
+    assert all(reading["value"] is None for reading in hud.values())
+
+
+def test_failed_readings_are_not_reused_for_unchanged_boxes():
+    reader = make_reader({"level": ("47", 95.0), "gold": ("30", 95.0)})
+    fields = boxes("level", "gold")
+    reader.read_hud_fields(fields)
+
+    reader.backend.readings["level"] = ("6", 95.0)
+    reader.backend.calls.clear()
+    hud = reader.read_hud_fields(fields, changed={"level": False, "gold": False})
+
+    assert reader.backend.calls == ["level"]
+    assert hud["level"]["value"] == 6
+    assert hud["gold"]["value"] == 30
+
+
+def test_game_stats_on_a_non_game_screen_report_no_level():
+    reader = make_reader({"level": ("83", 40.0), "gold": ("5", 40.0), "health": ("77", 40.0), "stage": ("", 0.0)})
+    reader.read_hud = lambda img: reader.read_hud_fields(boxes("level", "gold", "health", "stage"))
+
+    assert reader.read_game_stats(Image.new('RGB', (100, 100)))["level"] == 0
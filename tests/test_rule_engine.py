@@ -0,0 +1,184 @@
+import json
+import os
+import random
+
+import pytest
+
+from conftest import ROOT
+from utilities.game_state import GameState
+from utilities.rule_engine import RuleEngine
+
+
+def reference_evaluate(condition, game_state):
+    """Analyzer._evaluate_condition as it was before the rule engine"""
+    field = condition["field"]
+    operator = condition["operator"]
+    value = condition["value"]
+
+    if field == "level":
+        actual = game_state.level
+    elif field == "gold":
+        actual = game_state.gold
+    elif field == "health":
+        actual = game_state.health
+    elif field == "stage":
+        actual = game_state.stage
+    elif field.startswith("synergy."):
+        synergy_name = field.split(".")[1]
+        actual = game_state.synergies.get(synergy_name, 0)
+    elif field == "shop_has":
+        return value in game_state.available_shops
+    else:
+        return False
+
+    if operator == "gt":
+        return actual > value
+    elif operator == "gte":
+        return actual >= value
+    elif operator == "lt":
+        return actual < value
+    elif operator == "lte":
+        return actual <= value
+    elif operator == "eq":
+        return actual == value
+    elif operator == "contains":
+        return value in actual
+
+    return False
+
+
+RULES = [
+    {"condition": {"field": "level", "operator": "eq", "value": 5}, "recommendation": "level eq 5"},
+    {"condition": {"field": "gold", "operator": "gt", "value": 50}, "recommendation": "gold gt 50"},
+    {"condition": {"field": "gold", "operator": "lte", "value": 10}, "recommendation": "gold lte 10"},
+    {"condition": {"field": "health", "operator": "lt", "value": 40}, "recommendation": "health lt 40"},
+    {"condition": {"field": "health", "operator": "gte", "value": 90}, "recommendation": "health gte 90"},
+    {"condition": {"field": "stage", "operator": "contains", "value": "4-"}, "recommendation": "stage 4"},
+    {"condition": {"field": "synergy.Mystic", "operator": "gte", "value": 2}, "recommendation": "mystic"},
+    {"condition": {"field": "synergy.Knight", "operator": "eq", "value": 0}, "recommendation": "no knight"},
+    {"condition": {"field": "shop_has", "operator": "contains", "value": "Thresh"}, "recommendation": "thresh"},
+    {"condition": {"field": "round", "operator": "gt", "value": 1}, "recommendation": "unknown field"},
+    {"condition": {"field": "gold", "operator": "between", "value": 1}, "recommendation": "unknown operator"},
+]
+
+
+@pytest.fixture
+def config_path(tmp_path):
+    path = tmp_path / "config.json"
+    path.write_text(json.dumps({"rules": RULES}))
+    return str(path)
+
+
+def random_state(rng, state=None):
+    state = state or GameState()
+    # Change a random subset of fields so incremental evaluation is exercised
+    if rng.random() < 0.5:
+        state.level = rng.randint(1, 9)
+    if rng.random() < 0.5:
+        state.gold = rng.randint(0, 80)
+    if rng.random() < 0.5:
+        state.health = rng.randint(1, 100)
+    if rng.random() < 0.5:
+        state.stage = f"{rng.randint(1, 6)}-{rng.randint(1, 7)}"
+    if rng.random() < 0.5:
+        state.synergies = {name: rng.randint(0, 4) for name in rng.sample(["Mystic", "Knight", "Ranger"], 2)}
+    if rng.random() < 0.5:
+        state.available_shops = rng.sample(["Thresh", "Ahri", "Garen", "Lux", "Jinx"], 3)
+    return state
+
+
+def expected(rules, state):
+    return [rule["recommendation"] for rule in rules if reference_evaluate(rule["condition"], state)]
+
+
+def test_matches_reference_on_fresh_states(config_path):
+    engine = RuleEngine(config_path)
+    rng = random.Random(0)
+
+    for _ in range(500):
+        state = random_state(rng)
+        assert engine.evaluate(state) == expected(RULES, state)
+
+
+def test_matches_reference_when_one_state_is_mutated(config_path):
+    engine = RuleEngine(config_path)
+    rng = random.Random(1)
+    state = random_state(rng)
+
+    for _ in range(1000):
+        # In-place edits must be noticed too
+        state = random_state(rng, state)
+        if rng.random() < 0.3:
+            state.synergies["Mystic"] = rng.randint(0, 4)
+        if rng.random() < 0.3:
+            state.available_shops.append("Thresh")
+        assert engine.evaluate(state) == expected(RULES, state)
+
+
+def test_matches_reference_on_repo_config():
+    engine = RuleEngine(f"{ROOT}/config.json")
+    rules = engine.config["rules"]
+    rng = random.Random(2)
+
+    for _ in range(200):
+        state = random_state(rng)
+        assert engine.evaluate(state) == expected(rules, state)
+
+
+def test_only_dirty_rules_are_recomputed(config_path):
+    engine = RuleEngine(config_path)
+    state = random_state(random.Random(3))
+
+    engine.evaluate(state)
+    assert engine.last_recomputed == list(range(len(RULES)))
+
+    engine.evaluate(state)
+    assert engine.last_recomputed == []
+
+    state.gold += 1
+    engine.evaluate(state)
+    assert engine.last_recomputed == [1, 2, 10]
+
+
+def test_config_changes_are_picked_up(config_path):
+    engine = RuleEngine(config_path)
+    state = GameState()
+    state.gold = 60
+    assert "gold gt 50" in engine.evaluate(state)
+
+    with open(config_path, "w") as f:
+        json.dump({"rules": [{"condition": {"field": "gold", "operator": "gt", "value": 100}, "recommendation": "rich"}]}, f)
+    mtime = os.path.getmtime(config_path) + 1
+    os.utime(config_path, (mtime, mtime))
+
+    assert engine.evaluate(state) == []
+
+
+def test_bad_config_keeps_the_last_good_rules(config_path, capsys):
+    engine = RuleEngine(config_path)
+    state = GameState()
+    state.gold = 60
+    assert "gold gt 50" in engine.evaluate(state)
+
+    def rewrite(text, bump):
+        with open(config_path, "w") as f:
+            f.write(text)
+        mtime = os.path.getmtime(config_path) + bump
+        os.utime(config_path, (mtime, mtime))
+
+    # Half-written file, then a rule missing its recommendation
+    rewrite('{"rules": [{"condition": ', 1)
+    assert "gold gt 50" in engine.evaluate(state)
+    assert "gold gt 50" in engine.evaluate(state)
+    rewrite(json.dumps({"rules": [{"condition": {"field": "gold", "operator": "gt", "value": 1}}]}), 2)
+    assert "gold gt 50" in engine.evaluate(state)
+    assert capsys.readouterr().out.count("Failed to load rules") == 2
+
+    # Mid atomic replace: the file is briefly missing
+    os.remove(config_path)
+    assert "gold gt 50" in engine.evaluate(state)
+
+    rewrite(json.dumps({"rules": [{"condition": {"field": "gold", "operator": "gt", "value": 100}, "recommendation": "rich"}]}), 3)
+    assert engine.evaluate(state) == []
+    state.gold = 150
+    assert engine.evaluate(state) == ["rich"]
@@ -0,0 +1,47 @@
+import cv2
+import numpy as np
+from PIL import Image
+
+from utilities.change_detector import ChangeDetector
+from utilities.screen_capture import CapturedFrame, to_bgr
+
+
+def random_rgb(seed=0, shape=(12, 20, 3)):
+    return np.random.default_rng(seed).integers(0, 256, shape, dtype=np.uint8)
+
+
+def test_pil_images_are_converted_like_opencv():
+    rgb = random_rgb()
+
+    bgr = to_bgr(Image.fromarray(rgb))
+
+    assert np.array_equal(bgr, cv2.cvtColor(rgb, cv2.COLOR_RGB2BGR))
+    assert bgr.flags['C_CONTIGUOUS']
+
+
+def test_pil_images_with_alpha_drop_it():
+    rgba = np.dstack([random_rgb(1), np.full((12, 20), 255, dtype=np.uint8)])
+
+    assert to_bgr(Image.fromarray(rgba, 'RGBA')).shape == (12, 20, 3)
+
+
+def test_captured_frames_reuse_their_bgr_view():
+    bgra = np.dstack([random_rgb(2), np.zeros((12, 20), dtype=np.uint8)])
+    frame = CapturedFrame(bgra)
+
+    assert to_bgr(frame) is frame.bgr
+    assert np.array_equal(to_bgr(frame), bgra[:, :, :3])
+
+
+def test_arrays_pass_through():
+    bgr = random_rgb(3)
+
+    assert to_bgr(bgr) is bgr
+
+
+def test_frames_and_images_of_the_same_pixels_look_the_same_to_consumers():
+    rgb = random_rgb(4)
+    frame = CapturedFrame.from_pil(Image.fromarray(rgb))
+
+    detector = ChangeDetector()
+    assert np.array_equal(detector.fingerprint(frame), detector.fingerprint(Image.fromarray(rgb)))